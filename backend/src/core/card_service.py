@@ -47,6 +47,9 @@ STYLE_PRIORITY: List[ImageStyle] = [
     ImageStyle.SOVIET_POSTER,
     ImageStyle.VINTAGE_RUSSIAN,
 ]
+_STYLE_PRIORITY_RANK: Dict[ImageStyle, int] = {
+    style: rank for rank, style in enumerate(STYLE_PRIORITY)
+}
 _IMAGE_GENERATION_BATCH_SIZE = 3
 
 STYLE_HINTS: dict[ImageStyle, Sequence[str]] = {
@@ -389,7 +392,7 @@ class CardService:
 
         ranked_styles = sorted(
             scores.items(),
-            key=lambda item: (-item[1], STYLE_PRIORITY.index(item[0])),
+            key=lambda item: (-item[1], _STYLE_PRIORITY_RANK[item[0]]),
         )
         return [style for style, score in ranked_styles if score > 0]
 
@@ -455,7 +458,8 @@ class CardService:
                     continue
                 image_id = str(uuid.uuid4())
                 image_url = f"generated://{image_id}"
-                variant = PhotocardImageVariant(url=image_url, style=style)
+                # Both fields are produced here and already typed, so skip validation
+                variant = PhotocardImageVariant.model_construct(url=image_url, style=style)
                 variants.append(variant)
                 image_data[image_url] = image_bytes
                 if len(variants) == 3:
@@ -230,4 +230,7 @@ class PrintArchiveStore:
         return None
 
     def _to_public(self, asset: StoredPrintArchiveAsset) -> PrintArchiveAsset:
-        return PrintArchiveAsset.model_validate(asset.model_dump())
+        # Stored assets are already validated; copy the public fields without re-validating
+        return PrintArchiveAsset.model_construct(
+            **{name: getattr(asset, name) for name in PrintArchiveAsset.model_fields}
+        )
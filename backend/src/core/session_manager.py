@@ -12,7 +12,7 @@ from src.models.photocard import PhotocardImageVariant
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationSession:
     """Stored data for one generated photocard session."""
 
@@ -137,7 +137,7 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class VisualConcept:
     """Result of analyzing gratitude text for visual representation.
 
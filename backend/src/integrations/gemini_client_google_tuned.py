@@ -160,7 +160,7 @@ COMPOSITION NOTE:
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class ReferenceImage:
     """Image reference passed to Gemini as multimodal context.
 
@@ -3,6 +3,7 @@
 from src.models.card import (
     CardGenerationRequest,
     CardGenerationResponse,
+    ElementType,
     GenerateImagesRequest,
     GenerateImagesResponse,
     ImageStyle,
@@ -35,6 +36,7 @@ __all__ = [
     "ImageStyle",
     "CardGenerationRequest",
     "CardGenerationResponse",
+    "ElementType",
     "GenerateImagesRequest",
     "GenerateImagesResponse",
     "TextVariant",
@@ -1,8 +1,24 @@
 """Card-related Pydantic models."""
 
 from enum import Enum
-from typing import List, Literal, Optional
-from pydantic import BaseModel, Field, field_validator
+from types import MappingProxyType
+from typing import Annotated, List, Literal, Mapping, Optional
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints
+
+
+# Shared config for card models: immutable, strict about unknown fields and
+# built eagerly so validation stays on pydantic-core's static fast path.
+CARD_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    validate_assignment=False,
+    defer_build=False,
+    populate_by_name=False,
+    revalidate_instances="never",
+)
+
+# Card element kinds that can be regenerated or selected
+ElementType = Literal["text", "image"]
 
 
 class TextStyle(str, Enum):
@@ -17,23 +33,23 @@ class TextStyle(str, Enum):
 
 
 # All AI text styles (excluding ORIGINAL)
-AI_TEXT_STYLES = [
+AI_TEXT_STYLES: tuple[TextStyle, ...] = (
     TextStyle.ODE,
     TextStyle.HAIKU,
     TextStyle.FUTURE,
     TextStyle.STANDUP,
     TextStyle.NEWSPAPER,
-]
+)
 
 # Human-readable labels for text styles
-TEXT_STYLE_LABELS = {
+TEXT_STYLE_LABELS: Mapping[TextStyle, str] = MappingProxyType({
     TextStyle.ORIGINAL: "Оригинальный текст",
     TextStyle.ODE: "Торжественная ода",
     TextStyle.HAIKU: "Хайку",
     TextStyle.FUTURE: "Отчет из будущего",
     TextStyle.STANDUP: "Дружеский стендап",
     TextStyle.NEWSPAPER: "Заметка в газете",
-}
+})
 
 
 class ImageStyle(str, Enum):
@@ -63,7 +79,7 @@ class ImageStyle(str, Enum):
 
 
 # All image styles
-ALL_IMAGE_STYLES = [
+ALL_IMAGE_STYLES: tuple[ImageStyle, ...] = (
     ImageStyle.BENTO_GRID,
     ImageStyle.MINIMALIST_CORPORATE_LINE_ART,
     ImageStyle.QUIRKY_HAND_DRAWN_FLAT,
@@ -82,10 +98,10 @@ ALL_IMAGE_STYLES = [
     ImageStyle.POP_ART,
     ImageStyle.LEGO,
     ImageStyle.LINOCUT,
-]
+)
 
 # Human-readable labels for image styles
-IMAGE_STYLE_LABELS = {
+IMAGE_STYLE_LABELS: Mapping[ImageStyle, str] = MappingProxyType({
     ImageStyle.BENTO_GRID: "Модульная плитка",
     ImageStyle.MINIMALIST_CORPORATE_LINE_ART: "Минималистичный line-art",
     ImageStyle.QUIRKY_HAND_DRAWN_FLAT: "Игровой плоский стиль",
@@ -104,12 +120,14 @@ IMAGE_STYLE_LABELS = {
     ImageStyle.POP_ART: "Поп-арт",
     ImageStyle.LEGO: "LEGO",
     ImageStyle.LINOCUT: "Линогравюра",
-}
+})
 
 
 class TextVariant(BaseModel):
     """A single text variant for a greeting card."""
 
+    model_config = CARD_MODEL_CONFIG
+
     text: str = Field(..., description="The greeting text content", min_length=1)
     style: TextStyle = Field(..., description="The style used to generate this text")
 
@@ -117,6 +135,8 @@ class TextVariant(BaseModel):
 class ImageVariant(BaseModel):
     """A single image variant for a greeting card."""
 
+    model_config = CARD_MODEL_CONFIG
+
     url: str = Field(..., description="URL to the generated image")
     style: ImageStyle = Field(..., description="The style used to generate this image")
     prompt: str = Field(..., description="The prompt used to generate this image")
@@ -128,41 +148,28 @@ class CardGenerationRequest(BaseModel):
     Generates text variants. Images are generated separately via /cards/generate-images.
     """
 
-    recipient: str = Field(
-        ..., description="Full name of the card recipient", min_length=1
+    model_config = CARD_MODEL_CONFIG
+
+    # Name fields are stripped before length checks; the message is kept as written
+    recipient: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)] = Field(
+        ..., description="Full name of the card recipient"
     )
-    sender: Optional[str] = Field(
+    sender: Optional[Annotated[str, StringConstraints(strip_whitespace=True)]] = Field(
         None, description="Name of the sender (optional)", max_length=100
     )
-    reason: Optional[str] = Field(
+    reason: Optional[Annotated[str, StringConstraints(strip_whitespace=True)]] = Field(
         None, description="Reason for gratitude (optional)", max_length=150
     )
     message: Optional[str] = Field(
         None, description="Custom message from sender (optional)", max_length=1000
     )
 
-    @field_validator("recipient")
-    @classmethod
-    def validate_recipient(cls, v: str) -> str:
-        """Validate recipient name is not empty after stripping whitespace.
-
-        Args:
-            v: Recipient name to validate.
-
-        Returns:
-            Validated recipient name.
-
-        Raises:
-            ValueError: If name is empty or contains only whitespace.
-        """
-        if not v.strip():
-            raise ValueError("Recipient name cannot be empty")
-        return v.strip()
-
 
 class GenerateImagesRequest(BaseModel):
     """Request model for generating images for selected styles."""
 
+    model_config = CARD_MODEL_CONFIG
+
     session_id: str = Field(..., description="Session ID from initial generation")
     image_styles: List[ImageStyle] = Field(
         ...,
@@ -175,17 +182,23 @@ class GenerateImagesRequest(BaseModel):
 class CardGenerationResponse(BaseModel):
     """Response model for card generation."""
 
+    model_config = CARD_MODEL_CONFIG
+
     session_id: str = Field(..., description="Unique session ID for this generation")
     recipient: str = Field(..., description="Recipient name from request")
     original_text: Optional[str] = Field(
         None, description="Original user message (if provided)"
     )
-    text_variants: List[TextVariant] = Field(
-        ..., description="List of generated text variants (5 styles)", min_length=1
+    text_variants: tuple[TextVariant, ...] = Field(
+        ...,
+        description="Generated text variants (at most one per AI style)",
+        min_length=1,
+        max_length=len(AI_TEXT_STYLES),
     )
-    image_variants: List[ImageVariant] = Field(
-        default_factory=list,
-        description="List of generated image variants (empty until generate-images called)",
+    image_variants: tuple[ImageVariant, ...] = Field(
+        default=(),
+        description="Generated image variants (empty until generate-images called)",
+        max_length=4,
     )
     remaining_text_regenerations: int = Field(
         ..., description="Number of text regenerations remaining"
@@ -198,8 +211,10 @@ class CardGenerationResponse(BaseModel):
 class GenerateImagesResponse(BaseModel):
     """Response model for image generation."""
 
-    image_variants: List[ImageVariant] = Field(
-        ..., description="List of generated image variants", min_length=1
+    model_config = CARD_MODEL_CONFIG
+
+    image_variants: tuple[ImageVariant, ...] = Field(
+        ..., description="Generated image variants (1-4)", min_length=1, max_length=4
     )
     remaining_image_regenerations: int = Field(
         ..., description="Number of image regenerations remaining"
@@ -212,8 +227,10 @@ class RegenerateRequest(BaseModel):
     Regenerates ALL variants of the specified type (all 5 texts or all 4 images).
     """
 
+    model_config = CARD_MODEL_CONFIG
+
     session_id: str = Field(..., description="Session ID from initial generation")
-    element_type: Literal["text", "image"] = Field(
+    element_type: ElementType = Field(
         ..., description="Type of element to regenerate: 'text' or 'image'"
     )
 
@@ -221,6 +238,8 @@ class RegenerateRequest(BaseModel):
 class SendCardRequest(BaseModel):
     """Request model for sending a card to Telegram."""
 
+    model_config = CARD_MODEL_CONFIG
+
     session_id: str = Field(..., description="Session ID from generation")
     employee_name: str = Field(..., description="Employee name for the card")
     selected_text_index: int = Field(
@@ -242,8 +261,10 @@ class SendCardRequest(BaseModel):
 class SendCardResponse(BaseModel):
     """Response model after sending a card."""
 
+    model_config = CARD_MODEL_CONFIG
+
     success: bool = Field(..., description="Whether the card was sent successfully")
     message: str = Field(..., description="Status message")
-    telegram_message_id: int | None = Field(
-        None, description="Telegram message ID if sent successfully"
+    telegram_message_id: Optional[int] = Field(
+        None, description="Telegram message ID if sent successfully", strict=True
     )
@@ -1,7 +1,9 @@
 """Employee-related Pydantic models."""
 
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+from src.models.card import CARD_MODEL_CONFIG
 
 
 class Employee(BaseModel):
@@ -10,6 +12,20 @@ class Employee(BaseModel):
     Represents an employee in the system with basic information.
     """
 
+    model_config = ConfigDict(
+        CARD_MODEL_CONFIG,
+        # Records come from the employees data file, so unknown columns are ignored
+        extra="ignore",
+        json_schema_extra={
+            "example": {
+                "id": "1",
+                "name": "Иванов Иван Иванович",
+                "department": "IT",
+                "telegram": "@ivanov_ivan",
+            }
+        },
+    )
+
     id: str = Field(..., description="Unique employee identifier")
     name: str = Field(..., description="Full name of the employee", min_length=1)
     department: Optional[str] = Field(None, description="Department name (optional)")
@@ -17,15 +33,3 @@ class Employee(BaseModel):
         None,
         description="Telegram username (@username) or user ID for mention"
     )
-
-    class Config:
-        """Pydantic model configuration."""
-
-        json_schema_extra = {
-            "example": {
-                "id": "1",
-                "name": "Иванов Иван Иванович",
-                "department": "IT",
-                "telegram": "@ivanov_ivan",
-            }
-        }
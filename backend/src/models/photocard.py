@@ -64,6 +64,7 @@ class PhotocardSendResponse(BaseModel):
     telegram_message_id: int | None = Field(
         None,
         description="Telegram message ID if sending succeeded",
+        strict=True,
     )
     delivery_env: Literal["staging", "prod"] = Field(
         ...,
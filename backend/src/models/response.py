@@ -1,10 +1,10 @@
 """Generic API response models."""
 
-from typing import Generic, List, Optional, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from pydantic import BaseModel, Field
 
-from src.models.card import ImageVariant, TextVariant
+from src.models.card import AI_TEXT_STYLES, CARD_MODEL_CONFIG, ImageVariant, TextVariant
 
 T = TypeVar("T")
 
@@ -28,11 +28,17 @@ class RegenerateResponse(BaseModel):
     and the number of regenerations remaining for that element type.
     """
 
-    text_variants: Optional[List[TextVariant]] = Field(
-        None, description="New text variants if text was regenerated"
+    model_config = CARD_MODEL_CONFIG
+
+    text_variants: Optional[tuple[TextVariant, ...]] = Field(
+        None,
+        description="New text variants if text was regenerated",
+        max_length=len(AI_TEXT_STYLES),
     )
-    image_variants: Optional[List[ImageVariant]] = Field(
-        None, description="New image variants if images were regenerated"
+    image_variants: Optional[tuple[ImageVariant, ...]] = Field(
+        None,
+        description="New image variants if images were regenerated",
+        max_length=4,
     )
     remaining_regenerations: int = Field(
         ..., description="Number of regenerations remaining", ge=0
@@ -1,21 +1,28 @@
 """Employee repository for data access operations."""
 
+import asyncio
 import json
 import logging
-from typing import List, Optional
-
-import aiofiles
+import os
+from typing import Dict, List, Optional, Tuple
 
 from src.config import settings
 from src.models.employee import Employee
 
 logger = logging.getLogger(__name__)
 
+# Files larger than this are read in a worker thread; smaller ones are read
+# inline because the executor round-trip costs more than the read itself.
+_THREAD_READ_THRESHOLD_BYTES = 256 * 1024
+
 
 class EmployeeRepository:
     """Repository for employee data operations.
 
-    Handles reading employee data from JSON file with async operations.
+    Handles reading employee data from JSON file. The file is small, so it is
+    read synchronously unless it grows past ``_THREAD_READ_THRESHOLD_BYTES``.
+    Parsed employees are cached together with a lowercased-name index and
+    reloaded only when the file's modification time, size or inode changes.
     """
 
     def __init__(self, file_path: Optional[str] = None) -> None:
@@ -25,6 +32,10 @@ class EmployeeRepository:
             file_path: Path to employees JSON file. Uses settings default if not provided.
         """
         self.file_path = file_path or settings.employees_file_path
+        self._cache: Optional[List[Employee]] = None
+        self._cache_stamp: Optional[Tuple[int, int, int]] = None
+        self._by_name_lower: Dict[str, Employee] = {}
+        self._load_lock = asyncio.Lock()
         logger.info(f"Initialized EmployeeRepository with file: {self.file_path}")
 
     async def get_all(self) -> List[Employee]:
@@ -38,15 +49,52 @@ class EmployeeRepository:
             json.JSONDecodeError: If file contains invalid JSON.
             Exception: For other unexpected errors during file reading.
         """
-        try:
-            logger.debug(f"Reading employees from: {self.file_path}")
+        return list(await self._load())
+
+    async def _load(self) -> List[Employee]:
+        """Return cached employees, reloading them if the data file changed.
 
-            async with aiofiles.open(self.file_path, mode="r", encoding="utf-8") as file:
-                content = await file.read()
+        Returns:
+            The cached employee list (callers must not mutate it).
+
+        Raises:
+            FileNotFoundError: If employee data file doesn't exist.
+            json.JSONDecodeError: If file contains invalid JSON.
+            Exception: For other unexpected errors during file reading.
+        """
+        try:
+            file_stat = os.stat(self.file_path)
+            cached = self._cached_if_fresh(file_stat)
+            if cached is not None:
+                return cached
+
+            # Concurrent callers wait for the in-flight load instead of
+            # each reading and parsing the file themselves.
+            async with self._load_lock:
+                file_stat = os.stat(self.file_path)
+                cached = self._cached_if_fresh(file_stat)
+                if cached is not None:
+                    return cached
+
+                logger.debug(f"Reading employees from: {self.file_path}")
+
+                if file_stat.st_size > _THREAD_READ_THRESHOLD_BYTES:
+                    content = await asyncio.to_thread(self._read_file)
+                else:
+                    content = self._read_file()
                 data = json.loads(content)
 
-            # Validate and parse employee data
-            employees = [Employee(**employee_data) for employee_data in data]
+                # Validate and parse employee data
+                employees = [Employee(**employee_data) for employee_data in data]
+
+                # First occurrence wins, matching the previous linear scan
+                by_name_lower: Dict[str, Employee] = {}
+                for employee in employees:
+                    by_name_lower.setdefault(employee.name.lower().strip(), employee)
+
+                self._cache = employees
+                self._cache_stamp = self._file_stamp(file_stat)
+                self._by_name_lower = by_name_lower
 
             logger.info(f"Successfully loaded {len(employees)} employees")
             return employees
@@ -61,6 +109,43 @@ class EmployeeRepository:
             logger.exception(f"Unexpected error reading employee data: {e}")
             raise
 
+    def _cached_if_fresh(self, file_stat: os.stat_result) -> Optional[List[Employee]]:
+        """Return cached employees if they still match the file on disk.
+
+        Args:
+            file_stat: Current stat result of the data file.
+
+        Returns:
+            Cached employee list, or None if nothing is cached or the file changed.
+        """
+        if self._file_stamp(file_stat) != self._cache_stamp:
+            return None
+        return self._cache
+
+    @staticmethod
+    def _file_stamp(file_stat: os.stat_result) -> Tuple[int, int, int]:
+        """Identify a version of the data file.
+
+        Size and inode are compared alongside mtime so a rewrite within one
+        coarse timestamp tick, or an atomic replace, still triggers a reload.
+
+        Args:
+            file_stat: Stat result of the data file.
+
+        Returns:
+            Tuple of modification time (ns), size and inode number.
+        """
+        return (file_stat.st_mtime_ns, file_stat.st_size, file_stat.st_ino)
+
+    def _read_file(self) -> bytes:
+        """Read the raw employee data file.
+
+        Returns:
+            File contents as bytes.
+        """
+        with open(self.file_path, mode="rb") as file:
+            return file.read()
+
     async def get_by_name(self, name: str) -> Optional[Employee]:
         """Get employee by exact name match.
 
@@ -75,20 +160,18 @@ class EmployeeRepository:
             json.JSONDecodeError: If file contains invalid JSON.
         """
         try:
-            logger.debug(f"Searching for employee: {name}")
+            await self._load()
 
-            employees = await self.get_all()
+            # Case-insensitive search via the index built at load time
+            employee = self._by_name_lower.get(name.lower().strip())
 
-            # Case-insensitive search
-            name_lower = name.lower().strip()
-            for employee in employees:
-                if employee.name.lower().strip() == name_lower:
-                    logger.info(f"Found employee: {employee.name} (id: {employee.id})")
-                    return employee
+            if employee is not None:
+                logger.info("Found employee: %s (id: %s)", employee.name, employee.id)
+                return employee
 
-            logger.info(f"Employee not found: {name}")
+            logger.info("Employee not found: %s", name)
             return None
 
         except Exception as e:
-            logger.error(f"Error searching for employee {name}: {e}")
+            logger.error("Error searching for employee %s: %s", name, e)
             raise
@@ -1,22 +1,50 @@
-"""Shared pytest fixtures for backend tests."""
+"""Shared pytest fixtures for backend tests.
 
-from unittest.mock import AsyncMock, MagicMock
+Only fixtures used by more than one test module live here; single-consumer
+fixtures sit next to their tests. Models are imported inside the fixtures
+that need them, so selecting a subset of tests (``pytest -k``) only pays
+for the imports those tests actually use.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterator
 
 import pytest
+import pytest_asyncio
 
 from src.config import settings
-from src.models.card import ImageStyle
-from src.models.photocard import (
-    PhotocardGenerateRequest,
-    PhotocardGenerateResponse,
-    PhotocardImageVariant,
-    PhotocardSendResponse,
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+    from httpx import AsyncClient
+
+    from src.models.photocard import (
+        PhotocardGenerateRequest,
+        PhotocardGenerateResponse,
+        PhotocardImageVariant,
+        PhotocardSendResponse,
+    )
+
+_SAMPLE_IMAGE_URLS = (
+    "generated://image-001",
+    "generated://image-002",
+    "generated://image-003",
 )
+_SAMPLE_IMAGE_DATA = dict(zip(_SAMPLE_IMAGE_URLS, (b"png-1", b"png-2", b"png-3"), strict=False))
+_FAKE_MESSAGE_ID = 12345
 
 
 @pytest.fixture(scope="session", autouse=True)
-def configure_settings_for_tests():
-    """Set test-friendly settings overrides for the duration of the session."""
+def configure_settings_for_tests(tmp_path_factory: pytest.TempPathFactory):
+    """Set test-friendly settings overrides for the duration of the session.
+
+    Storage paths live under the session's base temp directory, which
+    pytest-xdist makes unique per worker, so parallel runs never share files.
+    """
+    storage_root = tmp_path_factory.mktemp("storage")
     original_values = {
         "rate_limit_per_minute": settings.rate_limit_per_minute,
         "telegram_delivery_env": settings.telegram_delivery_env,
@@ -39,9 +67,9 @@ def configure_settings_for_tests():
     object.__setattr__(settings, "telegram_prod_topic_id", 456)
     object.__setattr__(settings, "telegram_chat_id", -1009876543210)
     object.__setattr__(settings, "telegram_topic_id", 456)
-    object.__setattr__(settings, "print_archive_storage_path", "/tmp/cards-test-print-archive")
+    object.__setattr__(settings, "print_archive_storage_path", str(storage_root / "print-archive"))
     object.__setattr__(settings, "print_archive_password", "Pr0ffes4.0Pr0ffes4.0")
-    object.__setattr__(settings, "tap_p40_leaderboard_path", "/tmp/cards-test-tap-p40.json")
+    object.__setattr__(settings, "tap_p40_leaderboard_path", str(storage_root / "tap-p40.json"))
 
     yield
 
@@ -49,121 +77,138 @@ def configure_settings_for_tests():
         object.__setattr__(settings, key, value)
 
 
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Import the FastAPI app on first use rather than at collection time.
+
+    Building the app registers every router and middleware; modules that only
+    test models or services, and ``pytest --collect-only``, never pay for it.
+    """
+    from src.main import app
+
+    return app
+
+
+@pytest_asyncio.fixture(scope="session")
+async def _async_client(app: FastAPI) -> AsyncIterator[AsyncClient]:
+    """Run the app lifespan once and share an in-process ASGI client across the session.
+
+    ``ASGITransport`` calls the app directly on the running event loop, so
+    requests skip the portal thread that the sync ``TestClient`` uses.
+    """
+    from httpx import ASGITransport, AsyncClient
+
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(
+            transport=ASGITransport(app=app),
+            base_url="http://testserver",
+        ) as async_client:
+            yield async_client
+
+
 @pytest.fixture
+def client(_async_client: AsyncClient) -> AsyncClient:
+    """Return the shared async client with cookies from earlier tests cleared."""
+    _async_client.cookies.clear()
+    return _async_client
+
+
+@pytest.fixture
+def override_dependency(app: FastAPI) -> Iterator[Callable[[Callable[..., Any], Any], None]]:
+    """Return a helper that makes the app resolve a dependency to a fixed value.
+
+    Teardown pops only the dependencies registered through the helper, so
+    overrides owned by other fixtures stay in place.
+    """
+    registered: list[Callable[..., Any]] = []
+
+    def _override(dependency: Callable[..., Any], value: Any) -> None:
+        app.dependency_overrides[dependency] = lambda: value
+        registered.append(dependency)
+
+    yield _override
+
+    for dependency in registered:
+        app.dependency_overrides.pop(dependency, None)
+
+
+@pytest.fixture(scope="session")
+def session_now() -> datetime:
+    """Freeze a single timezone-aware "now" for the whole test session."""
+    return datetime.now(timezone.utc)
+
+
+@pytest.fixture(scope="session")
 def sample_photocard_request() -> PhotocardGenerateRequest:
     """Create a sample photocard generation request."""
+    from src.models.photocard import PhotocardGenerateRequest
+
     return PhotocardGenerateRequest(
         full_name="Jane Frost",
         alter_ego="Cyberpunk snow captain",
     )
 
 
-@pytest.fixture
-def sample_image_variants() -> list[PhotocardImageVariant]:
-    """Create three generated image variants."""
-    return [
-        PhotocardImageVariant(
-            url="generated://image-001",
-            style=ImageStyle.CYBERPUNK,
-        ),
-        PhotocardImageVariant(
-            url="generated://image-002",
-            style=ImageStyle.HYPERREALISM,
-        ),
-        PhotocardImageVariant(
-            url="generated://image-003",
-            style=ImageStyle.FANTASY,
-        ),
-    ]
+@pytest.fixture(scope="session")
+def _sample_image_variants_ro() -> tuple[PhotocardImageVariant, ...]:
+    """Create one generated image variant per sample URL once per session.
+
+    The values are known-valid, so ``model_construct`` skips validation.
+    """
+    from src.models.card import ImageStyle
+    from src.models.photocard import PhotocardImageVariant
+
+    styles = (ImageStyle.CYBERPUNK, ImageStyle.HYPERREALISM, ImageStyle.FANTASY)
+    return tuple(
+        PhotocardImageVariant.model_construct(url=url, style=style)
+        for url, style in zip(_SAMPLE_IMAGE_URLS, styles, strict=False)
+    )
 
 
 @pytest.fixture
-def sample_image_data(sample_image_variants: list[PhotocardImageVariant]) -> dict[str, bytes]:
-    """Create fake PNG bytes for the sample variants."""
-    return {
-        variant.url: f"png-{index}".encode("utf-8")
-        for index, variant in enumerate(sample_image_variants, start=1)
-    }
+def sample_image_variants(
+    _sample_image_variants_ro: tuple[PhotocardImageVariant, ...],
+) -> list[PhotocardImageVariant]:
+    """Return a fresh list of the sample variants that tests may mutate."""
+    return list(_sample_image_variants_ro)
 
 
 @pytest.fixture
+def sample_image_data() -> dict[str, bytes]:
+    """Return a fresh dict of fake PNG bytes keyed by the sample variant URLs.
+
+    Session stores keep the dict by reference, so each test gets its own copy.
+    """
+    return dict(_SAMPLE_IMAGE_DATA)
+
+
+@pytest.fixture(scope="session")
 def sample_generate_response(
-    sample_image_variants: list[PhotocardImageVariant],
+    _sample_image_variants_ro: tuple[PhotocardImageVariant, ...],
 ) -> PhotocardGenerateResponse:
-    """Create a sample generate response."""
-    return PhotocardGenerateResponse(
+    """Create a sample generate response from known-valid fields, skipping validation."""
+    from src.models.photocard import PhotocardGenerateResponse
+
+    return PhotocardGenerateResponse.model_construct(
         session_id="test-session-123",
-        image_variants=sample_image_variants,
+        image_variants=list(_sample_image_variants_ro),
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_send_response() -> PhotocardSendResponse:
-    """Create a sample send response."""
-    return PhotocardSendResponse(
+    """Create a sample send response from known-valid fields, skipping validation."""
+    from src.models.photocard import PhotocardSendResponse
+
+    return PhotocardSendResponse.model_construct(
         success=True,
         message="Photocard sent successfully",
-        telegram_message_id=12345,
+        telegram_message_id=_FAKE_MESSAGE_ID,
         delivery_env="staging",
     )
 
 
-@pytest.fixture
-def mock_gemini_client() -> AsyncMock:
-    """Create a mock Gemini client for service tests."""
-    client = AsyncMock()
-    client.generate_image_direct = AsyncMock(
-        return_value=(b"\x89PNGtest-image", "prompt"),
-    )
-    client.close = AsyncMock()
-    return client
-
-
-@pytest.fixture
-def mock_telegram_client() -> AsyncMock:
-    """Create a mock Telegram client for service tests."""
-    client = AsyncMock()
-    client.delivery_env = "staging"
-    client.send_photocard = AsyncMock(return_value=12345)
-    client.send_card = AsyncMock(return_value=12345)
-    client.close = AsyncMock()
-    return client
-
-
-@pytest.fixture
-def mock_print_archive_store() -> MagicMock:
-    """Create a mock print archive store for service tests."""
-    store = MagicMock()
-    store.save_asset = MagicMock()
-    store.list_assets = MagicMock(return_value=[])
-    store.get_asset = MagicMock(return_value=None)
-    store.get_asset_file_path = MagicMock(return_value=None)
-    store.build_zip_bytes = MagicMock(return_value=b"PK\x03\x04")
-    return store
-
-
-@pytest.fixture
-def mock_telegram_message() -> MagicMock:
-    """Create a mock Telegram API message."""
-    message = MagicMock()
-    message.message_id = 12345
-    return message
-
-
-@pytest.fixture
-def sample_employee_data() -> list[dict]:
-    """Create employee data used by employee repository tests."""
-    return [
-        {
-            "id": "1",
-            "name": "John Doe",
-            "department": "Engineering",
-            "telegram": "@john_doe",
-        },
-        {
-            "id": "2",
-            "name": "Jane Smith",
-            "department": "Marketing",
-            "telegram": "@jane_smith",
-        },
-    ]
+@pytest.fixture(scope="session")
+def mock_telegram_message() -> SimpleNamespace:
+    """Create a stand-in Telegram API message exposing only ``message_id``."""
+    return SimpleNamespace(message_id=_FAKE_MESSAGE_ID)
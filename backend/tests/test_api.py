@@ -1,49 +1,144 @@
 """Endpoint contract tests for the MVP photocard API."""
 
+import asyncio
+from typing import Any, Awaitable, Callable
 from unittest.mock import AsyncMock, MagicMock
 
+import orjson
 import pytest
 from fastapi import HTTPException
+from httpx import AsyncClient, Response
+from pydantic import BaseModel
 
+from src.api.dependencies import get_card_service
 from src.api.photocards import generate_photocard, send_photocard
-from src.core import CardService
 from src.core.exceptions import CardServiceError, SessionNotFoundError, VariantNotFoundError
-from src.main import health_check
-from src.models.photocard import PhotocardGenerateRequest, PhotocardSendRequest
+from src.models.photocard import (
+    PhotocardGenerateRequest,
+    PhotocardGenerateResponse,
+    PhotocardImageVariant,
+    PhotocardSendRequest,
+    PhotocardSendResponse,
+)
+
+# Run on the session event loop that owns the shared ASGI client, and keep the
+# module-scoped service stub built once, on a single xdist worker
+pytestmark = [
+    pytest.mark.asyncio(loop_scope="session"),
+    pytest.mark.xdist_group("photocard_api"),
+]
+
+_GENERATE_URL = "/api/v1/photocards/generate"
+_SEND_URL = "/api/v1/photocards/send"
+_JSON_HEADERS = {"content-type": "application/json"}
+_IMAGE_URL = "/api/v1/photocards/images/test-session-123/image-001"
+_SAMPLE_PNG = b"\x89PNG\r\n\x1a\n" + bytes(100)
+_VALID_GENERATE_BODY = orjson.dumps({"full_name": "Jane Frost", "alter_ego": "Snow captain"})
+_HEALTH_KEYS = {"status", "service", "version"}
+
+
+def _json_body(response: Response, status_code: int = 200) -> Any:
+    """Assert the response status and decode its JSON body once with orjson."""
+    assert response.status_code == status_code, response.text
+    return orjson.loads(response.content)
+
+
+class _StubCardService:
+    """Stand-in exposing only the CardService methods the photocard endpoints call.
+
+    Plain ``AsyncMock`` attributes avoid the ``spec=CardService`` introspection
+    a ``MagicMock`` would run over the whole class.
+    """
+
+    def __init__(self) -> None:
+        self.generate_photocard = AsyncMock()
+        self.send_photocard = AsyncMock()
+        self.get_image_data = MagicMock()
+        self.get_session = MagicMock()
+
+    def reset_mock(self) -> None:
+        """Clear calls and any configured return values or side effects."""
+        for method in (
+            self.generate_photocard,
+            self.send_photocard,
+            self.get_image_data,
+            self.get_session,
+        ):
+            method.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def _card_service_template() -> _StubCardService:
+    """Build the photocard service stub once per module."""
+    return _StubCardService()
+
+
+@pytest.fixture(scope="module")
+def sample_send_request() -> PhotocardSendRequest:
+    """Create a send request for an existing session."""
+    return PhotocardSendRequest.model_construct(
+        session_id="test-session-123",
+        selected_image_index=1,
+    )
 
 
 @pytest.fixture
-def mock_card_service() -> MagicMock:
-    """Create a mocked photocard service."""
-    return MagicMock(spec=CardService)
+def mock_card_service(_card_service_template: _StubCardService) -> _StubCardService:
+    """Return the photocard service stub with calls and configured results cleared."""
+    _card_service_template.reset_mock()
+    return _card_service_template
+
+
+@pytest.fixture
+def overridden_card_service(
+    mock_card_service: _StubCardService,
+    override_dependency,
+) -> _StubCardService:
+    """Serve the photocard service stub to the running app for HTTP-level tests."""
+    override_dependency(get_card_service, mock_card_service)
+    return mock_card_service
 
 
 class TestHealthEndpoints:
     """Health checks that should remain available."""
 
-    @pytest.mark.asyncio
-    async def test_health_check_returns_ok(self) -> None:
-        response = await health_check()
+    async def test_health_check_returns_ok(self, client: AsyncClient) -> None:
+        response = await client.get("/health")
+
+        data = _json_body(response)
+        assert data["status"] == "healthy"
+        assert data.keys() == _HEALTH_KEYS
 
-        assert response["status"] == "healthy"
+
+class TestResponseSchemas:
+    """Required response fields the frontend relies on."""
+
+    @pytest.mark.parametrize(
+        ("model", "required"),
+        [
+            (PhotocardGenerateResponse, {"session_id", "image_variants"}),
+            (PhotocardImageVariant, {"url", "style"}),
+            (PhotocardSendResponse, {"success", "message", "delivery_env"}),
+        ],
+        ids=["generate", "image-variant", "send"],
+    )
+    async def test_required_fields(self, model: type[BaseModel], required: set[str]) -> None:
+        assert set(model.model_json_schema()["required"]) == required
 
 
 class TestPhotocardGenerateEndpoint:
     """Generation endpoint coverage."""
 
-    @pytest.mark.asyncio
     async def test_generate_success(
         self,
-        mock_card_service: MagicMock,
+        mock_card_service: _StubCardService,
+        sample_photocard_request: PhotocardGenerateRequest,
         sample_generate_response,
     ) -> None:
-        mock_card_service.generate_photocard = AsyncMock(return_value=sample_generate_response)
+        mock_card_service.generate_photocard.return_value = sample_generate_response
 
         response = await generate_photocard(
-            body=PhotocardGenerateRequest(
-                full_name="Jane Frost",
-                alter_ego="Cyberpunk snow captain",
-            ),
+            body=sample_photocard_request,
             service=mock_card_service,
         )
 
@@ -52,44 +147,45 @@ class TestPhotocardGenerateEndpoint:
         assert response.data.session_id == sample_generate_response.session_id
         assert len(response.data.image_variants) == 3
 
-    @pytest.mark.asyncio
-    async def test_generate_maps_service_error_to_500(
+    async def test_generate_serves_concurrent_requests(
         self,
-        mock_card_service: MagicMock,
+        client: AsyncClient,
+        overridden_card_service: _StubCardService,
+        sample_generate_response,
     ) -> None:
-        mock_card_service.generate_photocard = AsyncMock(
-            side_effect=CardServiceError("generation failed")
-        )
+        """Verifies that:
+        - Generate requests issued together on one loop all succeed
+        - Each request reaches the service exactly once
+        """
+        # Arrange
+        overridden_card_service.generate_photocard.return_value = sample_generate_response
 
-        with pytest.raises(HTTPException) as exc_info:
-            await generate_photocard(
-                body=PhotocardGenerateRequest(
-                    full_name="Jane Frost",
-                    alter_ego="Cyberpunk snow captain",
-                ),
-                service=mock_card_service,
+        # Act
+        responses = await asyncio.gather(
+            *(
+                client.post(_GENERATE_URL, content=_VALID_GENERATE_BODY, headers=_JSON_HEADERS)
+                for _ in range(5)
             )
+        )
 
-        assert exc_info.value.status_code == 500
-        assert exc_info.value.detail == "generation failed"
+        # Assert
+        assert [response.status_code for response in responses] == [200] * 5
+        assert overridden_card_service.generate_photocard.await_count == 5
 
 
 class TestPhotocardSendEndpoint:
     """Send endpoint coverage."""
 
-    @pytest.mark.asyncio
     async def test_send_success(
         self,
-        mock_card_service: MagicMock,
+        mock_card_service: _StubCardService,
+        sample_send_request: PhotocardSendRequest,
         sample_send_response,
     ) -> None:
-        mock_card_service.send_photocard = AsyncMock(return_value=sample_send_response)
+        mock_card_service.send_photocard.return_value = sample_send_response
 
         response = await send_photocard(
-            body=PhotocardSendRequest(
-                session_id="test-session-123",
-                selected_image_index=1,
-            ),
+            body=sample_send_request,
             service=mock_card_service,
         )
 
@@ -98,44 +194,201 @@ class TestPhotocardSendEndpoint:
         assert response.data.telegram_message_id == 12345
         assert response.data.delivery_env == "staging"
 
-    @pytest.mark.asyncio
-    async def test_send_missing_session_returns_404(
+    @pytest.mark.parametrize(
+        ("error", "status_code", "detail"),
+        [
+            (
+                SessionNotFoundError("missing-session"),
+                404,
+                "Session not found: missing-session",
+            ),
+            (VariantNotFoundError("image", 7), 404, "Image variant not found at index: 7"),
+        ],
+        ids=["missing-session", "invalid-image-index"],
+    )
+    async def test_send_maps_service_errors(
         self,
-        mock_card_service: MagicMock,
+        mock_card_service: _StubCardService,
+        sample_send_request: PhotocardSendRequest,
+        error: Exception,
+        status_code: int,
+        detail: str,
     ) -> None:
-        mock_card_service.send_photocard = AsyncMock(
-            side_effect=SessionNotFoundError("missing-session")
-        )
+        mock_card_service.send_photocard.side_effect = error
 
         with pytest.raises(HTTPException) as exc_info:
             await send_photocard(
-                body=PhotocardSendRequest(
-                    session_id="missing-session",
-                    selected_image_index=0,
-                ),
+                body=sample_send_request,
                 service=mock_card_service,
             )
 
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.detail == "Session not found: missing-session"
+        assert exc_info.value.status_code == status_code
+        assert exc_info.value.detail == detail
 
-    @pytest.mark.asyncio
-    async def test_send_invalid_image_index_returns_404(
+    async def test_send_parses_body_through_app(
         self,
-        mock_card_service: MagicMock,
+        client: AsyncClient,
+        overridden_card_service: _StubCardService,
+        sample_send_response,
     ) -> None:
-        mock_card_service.send_photocard = AsyncMock(
-            side_effect=VariantNotFoundError("image", 7)
+        """Verifies that:
+        - The raw JSON body is validated into a PhotocardSendRequest
+        - The parsed request reaches the service unchanged
+        """
+        # Arrange
+        overridden_card_service.send_photocard.return_value = sample_send_response
+
+        # Act
+        response = await client.post(
+            _SEND_URL,
+            content=orjson.dumps({"session_id": "test-session-123", "selected_image_index": 2}),
+            headers=_JSON_HEADERS,
         )
 
+        # Assert
+        assert _json_body(response)["data"]["telegram_message_id"] == 12345
+        (sent,) = overridden_card_service.send_photocard.await_args.args
+        assert isinstance(sent, PhotocardSendRequest)
+        assert (sent.session_id, sent.selected_image_index) == ("test-session-123", 2)
+
+
+class TestPhotocardImageEndpoint:
+    """Generated image download coverage."""
+
+    async def test_get_image_returns_png_bytes(
+        self,
+        client: AsyncClient,
+        overridden_card_service: _StubCardService,
+    ) -> None:
+        overridden_card_service.get_image_data.return_value = _SAMPLE_PNG
+
+        response = await client.get(_IMAGE_URL)
+
+        assert response.status_code == 200
+        assert response.content == _SAMPLE_PNG
+        assert response.headers["content-type"] == "image/png"
+        assert response.headers["content-length"] == str(len(_SAMPLE_PNG))
+        overridden_card_service.get_image_data.assert_called_once_with(
+            "test-session-123",
+            "generated://image-001",
+        )
+
+    @pytest.mark.parametrize(
+        ("session", "detail"),
+        [
+            (None, "Session not found: test-session-123"),
+            (object(), "Image not found: image-001"),
+        ],
+        ids=["missing-session", "missing-image"],
+    )
+    async def test_get_image_missing_returns_404(
+        self,
+        client: AsyncClient,
+        overridden_card_service: _StubCardService,
+        session: object,
+        detail: str,
+    ) -> None:
+        overridden_card_service.get_image_data.return_value = None
+        overridden_card_service.get_session.return_value = session
+
+        response = await client.get(_IMAGE_URL)
+
+        assert _json_body(response, 404)["detail"] == detail
+
+
+class TestPhotocardServiceErrors:
+    """Error mapping shared by every photocard endpoint."""
+
+    @pytest.mark.parametrize(
+        ("handler", "method_name", "body_fixture"),
+        [
+            (generate_photocard, "generate_photocard", "sample_photocard_request"),
+            (send_photocard, "send_photocard", "sample_send_request"),
+        ],
+        ids=["generate", "send"],
+    )
+    async def test_service_error_maps_to_500(
+        self,
+        request: pytest.FixtureRequest,
+        mock_card_service: _StubCardService,
+        handler: Callable[..., Awaitable[object]],
+        method_name: str,
+        body_fixture: str,
+    ) -> None:
+        getattr(mock_card_service, method_name).side_effect = CardServiceError("service failed")
+
         with pytest.raises(HTTPException) as exc_info:
-            await send_photocard(
-                body=PhotocardSendRequest(
-                    session_id="test-session-123",
-                    selected_image_index=7,
-                ),
+            await handler(
+                body=request.getfixturevalue(body_fixture),
                 service=mock_card_service,
             )
 
-        assert exc_info.value.status_code == 404
-        assert exc_info.value.detail == "Image variant not found at index: 7"
+        assert exc_info.value.status_code == 500
+        assert exc_info.value.detail == "service failed"
+
+
+class TestPhotocardRequestValidation:
+    """Malformed bodies are rejected before the service is reached."""
+
+    @pytest.mark.parametrize(
+        ("url", "body"),
+        [
+            (_GENERATE_URL, orjson.dumps({})),
+            (_GENERATE_URL, orjson.dumps({"full_name": "Jane Frost"})),
+            (_GENERATE_URL, orjson.dumps({"full_name": "  ", "alter_ego": "x"})),
+            (_GENERATE_URL, orjson.dumps({"full_name": "J" * 201, "alter_ego": "Snow captain"})),
+            (_SEND_URL, orjson.dumps({"selected_image_index": 0})),
+            (
+                _SEND_URL,
+                orjson.dumps({"session_id": "test-session-123", "selected_image_index": -1}),
+            ),
+            (
+                _SEND_URL,
+                orjson.dumps({"session_id": "test-session-123", "selected_image_index": "x"}),
+            ),
+        ],
+        ids=[
+            "generate-empty",
+            "generate-missing-alter-ego",
+            "generate-blank-name",
+            "generate-name-too-long",
+            "send-missing-session",
+            "send-negative-index",
+            "send-non-integer-index",
+        ],
+    )
+    async def test_invalid_body_returns_422(
+        self,
+        client: AsyncClient,
+        overridden_card_service: _StubCardService,
+        url: str,
+        body: bytes,
+    ) -> None:
+        response = await client.post(url, content=body, headers=_JSON_HEADERS)
+
+        assert "detail" in _json_body(response, 422)
+        overridden_card_service.generate_photocard.assert_not_called()
+        overridden_card_service.send_photocard.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("path", "model"),
+        [
+            ("/api/v1/photocards/generate", PhotocardGenerateRequest),
+            ("/api/v1/photocards/send", PhotocardSendRequest),
+        ],
+        ids=["generate", "send"],
+    )
+    async def test_openapi_documents_request_body(
+        self,
+        client: AsyncClient,
+        path: str,
+        model: type[BaseModel],
+    ) -> None:
+        openapi = _json_body(await client.get("/openapi.json"))
+
+        request_body = openapi["paths"][path]["post"]["requestBody"]
+
+        assert request_body["required"] is True
+        schema = request_body["content"]["application/json"]["schema"]
+        assert schema == {"$ref": f"#/components/schemas/{model.__name__}"}
+        assert model.__name__ in openapi["components"]["schemas"]
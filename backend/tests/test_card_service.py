@@ -1,125 +1,157 @@
 """Unit tests for the MVP photocard service."""
 
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+import pytest_asyncio
 
 from src.core.card_service import CardService
 from src.core.exceptions import SessionNotFoundError, VariantNotFoundError
+from src.core.print_archive import PrintArchiveStore
+from src.integrations.gemini import GeminiClient
+from src.integrations.telegram import TelegramClient
 from src.models.card import ImageStyle
-from src.models.photocard import PhotocardSendRequest
+from src.models.photocard import (
+    PhotocardGenerateRequest,
+    PhotocardGenerateResponse,
+    PhotocardSendRequest,
+)
+
+_FAKE_IMAGE_RESULT = (b"\x89PNGtest-image", "prompt")
+_FAKE_MESSAGE_ID = 12345
+_MISSING_SESSION_REQUEST = PhotocardSendRequest.model_construct(
+    session_id="missing-session",
+    selected_image_index=0,
+)
+_LEADING_STYLES = (
+    ImageStyle.BENTO_GRID,
+    ImageStyle.MINIMALIST_CORPORATE_LINE_ART,
+    ImageStyle.QUIRKY_HAND_DRAWN_FLAT,
+)
+
+
+@pytest.fixture(scope="session")
+def _gemini_client_template() -> AsyncMock:
+    """Build the configured Gemini client mock once per session."""
+    client = AsyncMock(spec=GeminiClient)
+    client.generate_image_direct = AsyncMock(return_value=_FAKE_IMAGE_RESULT)
+    return client
+
+
+@pytest.fixture
+def mock_gemini_client(_gemini_client_template: AsyncMock) -> AsyncMock:
+    """Return the Gemini client mock with call history cleared."""
+    _gemini_client_template.reset_mock(return_value=False, side_effect=False)
+    return _gemini_client_template
+
+
+@pytest.fixture(scope="session")
+def _telegram_client_template() -> AsyncMock:
+    """Build the configured Telegram client mock once per session."""
+    client = AsyncMock(spec=TelegramClient)
+    client.delivery_env = "staging"
+    client.send_photocard = AsyncMock(return_value=_FAKE_MESSAGE_ID)
+    return client
+
+
+@pytest.fixture
+def mock_telegram_client(_telegram_client_template: AsyncMock) -> AsyncMock:
+    """Return the Telegram client mock with call history cleared."""
+    _telegram_client_template.reset_mock(return_value=False, side_effect=False)
+    return _telegram_client_template
+
+
+@pytest.fixture(scope="session")
+def _print_archive_store_template() -> MagicMock:
+    """Build the print archive store mock once per session.
+
+    CardService only calls ``save_asset``, which the spec already provides.
+    """
+    return MagicMock(spec=PrintArchiveStore)
+
+
+@pytest.fixture
+def mock_print_archive_store(_print_archive_store_template: MagicMock) -> MagicMock:
+    """Return the print archive store mock with call history cleared."""
+    _print_archive_store_template.reset_mock(return_value=False, side_effect=False)
+    return _print_archive_store_template
+
+
+@pytest.fixture
+def card_service(
+    mock_gemini_client: AsyncMock,
+    mock_telegram_client: AsyncMock,
+    mock_print_archive_store: MagicMock,
+) -> CardService:
+    """Create a service with an empty session store around the shared client mocks."""
+    return CardService(
+        gemini_client=mock_gemini_client,
+        telegram_client=mock_telegram_client,
+        print_archive_store=mock_print_archive_store,
+        session_ttl_minutes=30,
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="function")
+async def generated_photocard(
+    card_service: CardService,
+    sample_photocard_request: PhotocardGenerateRequest,
+) -> PhotocardGenerateResponse:
+    """Generate the sample photocard so send tests start from a live session."""
+    return await card_service.generate_photocard(sample_photocard_request)
 
 
 class TestCardService:
     """Photocard generation and send behavior."""
 
     @pytest.mark.asyncio
-    async def test_generate_photocard_returns_exactly_three_images(
+    async def test_generate_photocard_returns_three_images_and_stores_session(
         self,
+        card_service: CardService,
         mock_gemini_client: AsyncMock,
-        mock_telegram_client: AsyncMock,
-        mock_print_archive_store,
         sample_photocard_request,
     ) -> None:
-        service = CardService(
-            gemini_client=mock_gemini_client,
-            telegram_client=mock_telegram_client,
-            print_archive_store=mock_print_archive_store,
-            session_ttl_minutes=30,
-        )
-
-        response = await service.generate_photocard(sample_photocard_request)
+        response = await card_service.generate_photocard(sample_photocard_request)
+        session = card_service.get_session(response.session_id)
 
         assert len(response.image_variants) == 3
         assert response.session_id
         assert mock_gemini_client.generate_image_direct.await_count == 3
-
-    def test_classify_styles_uses_keyword_matches(
-        self,
-        mock_gemini_client: AsyncMock,
-        mock_telegram_client: AsyncMock,
-        mock_print_archive_store,
-    ) -> None:
-        service = CardService(
-            gemini_client=mock_gemini_client,
-            telegram_client=mock_telegram_client,
-            print_archive_store=mock_print_archive_store,
-            session_ttl_minutes=30,
-        )
-
-        styles = service._build_style_candidates("cyber neon superhero")
-
-        assert styles[:3] == [
-            ImageStyle.BENTO_GRID,
-            ImageStyle.MINIMALIST_CORPORATE_LINE_ART,
-            ImageStyle.QUIRKY_HAND_DRAWN_FLAT,
-        ]
-
-    def test_classify_styles_falls_back_to_defaults_when_no_match(
-        self,
-        mock_gemini_client: AsyncMock,
-        mock_telegram_client: AsyncMock,
-        mock_print_archive_store,
-    ) -> None:
-        service = CardService(
-            gemini_client=mock_gemini_client,
-            telegram_client=mock_telegram_client,
-            print_archive_store=mock_print_archive_store,
-            session_ttl_minutes=30,
-        )
-
-        styles = service._build_style_candidates("plain office persona")
-
-        assert styles[:3] == [
-            ImageStyle.BENTO_GRID,
-            ImageStyle.MINIMALIST_CORPORATE_LINE_ART,
-            ImageStyle.QUIRKY_HAND_DRAWN_FLAT,
-        ]
-
-    @pytest.mark.asyncio
-    async def test_generate_photocard_stores_session_and_bytes(
-        self,
-        mock_gemini_client: AsyncMock,
-        mock_telegram_client: AsyncMock,
-        mock_print_archive_store,
-        sample_photocard_request,
-    ) -> None:
-        service = CardService(
-            gemini_client=mock_gemini_client,
-            telegram_client=mock_telegram_client,
-            print_archive_store=mock_print_archive_store,
-            session_ttl_minutes=30,
-        )
-
-        response = await service.generate_photocard(sample_photocard_request)
-        session = service.get_session(response.session_id)
-
         assert session is not None
         assert session.full_name == sample_photocard_request.full_name
         assert session.alter_ego == sample_photocard_request.alter_ego
         assert len(session.image_variants) == 3
         assert len(session.image_data) == 3
 
+    @pytest.mark.parametrize(
+        "alter_ego",
+        ["cyber neon superhero", "plain office persona"],
+        ids=["keyword-match", "no-match"],
+    )
+    def test_classify_styles_keeps_default_styles_first(
+        self,
+        card_service: CardService,
+        alter_ego: str,
+    ) -> None:
+        styles = card_service._build_style_candidates(alter_ego)
+
+        assert tuple(styles[:3]) == _LEADING_STYLES
+
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("selected_image_index", [0, 1, 2])
     async def test_send_photocard_uses_selected_image_and_caption_inputs(
         self,
-        mock_gemini_client: AsyncMock,
+        card_service: CardService,
         mock_telegram_client: AsyncMock,
-        mock_print_archive_store,
+        mock_print_archive_store: MagicMock,
         sample_photocard_request,
+        generated_photocard: PhotocardGenerateResponse,
+        selected_image_index: int,
     ) -> None:
-        service = CardService(
-            gemini_client=mock_gemini_client,
-            telegram_client=mock_telegram_client,
-            print_archive_store=mock_print_archive_store,
-            session_ttl_minutes=30,
-        )
-        generate_response = await service.generate_photocard(sample_photocard_request)
-
-        response = await service.send_photocard(
-            PhotocardSendRequest(
-                session_id=generate_response.session_id,
-                selected_image_index=1,
+        response = await card_service.send_photocard(
+            PhotocardSendRequest.model_construct(
+                session_id=generated_photocard.session_id,
+                selected_image_index=selected_image_index,
             )
         )
 
@@ -130,49 +162,28 @@ class TestCardService:
         assert call_kwargs["full_name"] == sample_photocard_request.full_name
         assert call_kwargs["alter_ego"] == sample_photocard_request.alter_ego
         assert mock_print_archive_store.save_asset.call_count == 2
+        selected_url = generated_photocard.image_variants[selected_image_index].url
+        archived_url = mock_print_archive_store.save_asset.call_args.kwargs["source_image_url"]
+        assert archived_url == selected_url
 
     @pytest.mark.asyncio
     async def test_send_photocard_raises_for_missing_session(
         self,
-        mock_gemini_client: AsyncMock,
-        mock_telegram_client: AsyncMock,
-        mock_print_archive_store,
+        card_service: CardService,
     ) -> None:
-        service = CardService(
-            gemini_client=mock_gemini_client,
-            telegram_client=mock_telegram_client,
-            print_archive_store=mock_print_archive_store,
-            session_ttl_minutes=30,
-        )
-
         with pytest.raises(SessionNotFoundError):
-            await service.send_photocard(
-                PhotocardSendRequest(
-                    session_id="missing-session",
-                    selected_image_index=0,
-                )
-            )
+            await card_service.send_photocard(_MISSING_SESSION_REQUEST)
 
     @pytest.mark.asyncio
     async def test_send_photocard_raises_for_invalid_image_index(
         self,
-        mock_gemini_client: AsyncMock,
-        mock_telegram_client: AsyncMock,
-        mock_print_archive_store,
-        sample_photocard_request,
+        card_service: CardService,
+        generated_photocard: PhotocardGenerateResponse,
     ) -> None:
-        service = CardService(
-            gemini_client=mock_gemini_client,
-            telegram_client=mock_telegram_client,
-            print_archive_store=mock_print_archive_store,
-            session_ttl_minutes=30,
-        )
-        generate_response = await service.generate_photocard(sample_photocard_request)
-
         with pytest.raises(VariantNotFoundError):
-            await service.send_photocard(
-                PhotocardSendRequest(
-                    session_id=generate_response.session_id,
+            await card_service.send_photocard(
+                PhotocardSendRequest.model_construct(
+                    session_id=generated_photocard.session_id,
                     selected_image_index=9,
                 )
             )
@@ -12,21 +12,87 @@ Test coverage:
 - File not found error handling
 """
 
+import asyncio
 import json
+import os
+from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, Mapping, Tuple
+from unittest.mock import MagicMock, patch
+
 import pytest
-from unittest.mock import patch, AsyncMock, MagicMock
-from typing import List
 
+from src.repositories import employee_repo as employee_repo_module
 from src.repositories.employee_repo import EmployeeRepository
 from src.models.employee import Employee
 
 
+# Single source of truth for the sample employees: read-only records plus
+# their data-file JSON, serialized once (default=dict handles the proxies).
+_SAMPLE_EMPLOYEE_DATA: Tuple[Mapping[str, str], ...] = tuple(
+    MappingProxyType(record)
+    for record in (
+        {
+            "id": "1",
+            "name": "John Doe",
+            "department": "Engineering",
+            "telegram": "@john_doe",
+        },
+        {
+            "id": "2",
+            "name": "Jane Smith",
+            "department": "Marketing",
+            "telegram": "@jane_smith",
+        },
+    )
+)
+
+
+_SAMPLE_EMPLOYEE_JSON = json.dumps(_SAMPLE_EMPLOYEE_DATA, default=dict)
+
+
+@pytest.fixture(scope="session")
+def sample_employee_data() -> Tuple[Mapping[str, str], ...]:
+    """Return immutable employee records used by employee repository tests."""
+    return _SAMPLE_EMPLOYEE_DATA
+
+
+@pytest.fixture(scope="session")
+def sample_employee_json() -> str:
+    """Return the sample employee records serialized as the data file content."""
+    return _SAMPLE_EMPLOYEE_JSON
+
+
+@pytest.fixture
+def mock_settings(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Swap in a settings mock on the repository module for the test's duration."""
+    patched_settings = MagicMock()
+    monkeypatch.setattr(employee_repo_module, "settings", patched_settings)
+    return patched_settings
+
+
+@pytest.fixture
+def write_employees_file(tmp_path: Path) -> Callable[[str], str]:
+    """Return a helper that writes raw content to a temporary employees file."""
+
+    def _write(content: str) -> str:
+        file_path = tmp_path / "employees.json"
+        file_path.write_text(content, encoding="utf-8")
+        return str(file_path)
+
+    return _write
+
+
 class TestGetAll:
     """Tests for get_all() method."""
 
     @pytest.mark.asyncio
     async def test_get_all_returns_employees(
-        self, sample_employee_data: List[dict]
+        self,
+        sample_employee_data: Tuple[Mapping[str, str], ...],
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
     ) -> None:
         """Test that get_all() returns all employees from the JSON file.
 
@@ -36,25 +102,14 @@ class TestGetAll:
         - Employee count matches the data file
         """
         # Arrange
-        mock_file_content = json.dumps(sample_employee_data)
-
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            # Create mock for async context manager
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
+        file_content = sample_employee_json
+        file_path = write_employees_file(file_content)
 
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
-
-                # Act
-                result = await repo.get_all()
+        # Act
+        result = await repo.get_all()
 
         # Assert
         assert len(result) == len(sample_employee_data)
@@ -63,7 +118,11 @@ class TestGetAll:
         assert result[0].id == sample_employee_data[0]["id"]
 
     @pytest.mark.asyncio
-    async def test_get_all_empty_file(self) -> None:
+    async def test_get_all_empty_file(
+        self,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that get_all() returns empty list for empty JSON array.
 
         Verifies that:
@@ -71,31 +130,25 @@ class TestGetAll:
         - Empty list is returned without errors
         """
         # Arrange
-        mock_file_content = "[]"
+        file_content = "[]"
+        file_path = write_employees_file(file_content)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
-
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
-
-                # Act
-                result = await repo.get_all()
+        # Act
+        result = await repo.get_all()
 
         # Assert
         assert result == []
         assert isinstance(result, list)
 
     @pytest.mark.asyncio
-    async def test_file_not_found_returns_empty(self) -> None:
+    async def test_file_not_found_returns_empty(
+        self,
+        tmp_path: Path,
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that FileNotFoundError is raised when file doesn't exist.
 
         Verifies that:
@@ -103,19 +156,19 @@ class TestGetAll:
         - Error is logged appropriately
         """
         # Arrange
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_aiofiles.open.side_effect = FileNotFoundError("File not found")
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/nonexistent/employees.json"
-                repo = EmployeeRepository()
+        mock_settings.employees_file_path = str(tmp_path / "missing.json")
+        repo = EmployeeRepository()
 
-                # Act & Assert
-                with pytest.raises(FileNotFoundError):
-                    await repo.get_all()
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            await repo.get_all()
 
     @pytest.mark.asyncio
-    async def test_get_all_handles_invalid_json(self) -> None:
+    async def test_get_all_handles_invalid_json(
+        self,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that invalid JSON raises JSONDecodeError.
 
         Verifies that:
@@ -123,29 +176,23 @@ class TestGetAll:
         - Error is logged for debugging
         """
         # Arrange
-        mock_file_content = "not valid json {"
-
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
+        file_content = "not valid json {"
+        file_path = write_employees_file(file_content)
 
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
-
-                # Act & Assert
-                with pytest.raises(json.JSONDecodeError):
-                    await repo.get_all()
+        # Act & Assert
+        with pytest.raises(json.JSONDecodeError):
+            await repo.get_all()
 
     @pytest.mark.asyncio
     async def test_get_all_with_custom_file_path(
-        self, sample_employee_data: List[dict]
+        self,
+        sample_employee_data: Tuple[Mapping[str, str], ...],
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
     ) -> None:
         """Test that custom file path can be provided to constructor.
 
@@ -154,31 +201,109 @@ class TestGetAll:
         - Data is loaded from the custom path
         """
         # Arrange
-        custom_path = "/custom/path/employees.json"
-        mock_file_content = json.dumps(sample_employee_data)
+        custom_path = write_employees_file(sample_employee_json)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
+        mock_settings.employees_file_path = "/nonexistent/employees.json"
+        repo = EmployeeRepository(file_path=custom_path)
 
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
+        # Act
+        result = await repo.get_all()
 
-            mock_aiofiles.open.return_value = mock_open_cm
+        # Assert
+        assert repo.file_path == custom_path
+        assert len(result) == len(sample_employee_data)
+
+    @pytest.mark.asyncio
+    async def test_get_all_reads_large_file_in_thread(
+        self,
+        sample_employee_data: Tuple[Mapping[str, str], ...],
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that files above the size threshold are read off the event loop.
+
+        Verifies that:
+        - asyncio.to_thread is used for large files
+        - Data is still parsed correctly
+        """
+        # Arrange
+        file_path = write_employees_file(sample_employee_json)
+        repo = EmployeeRepository(file_path=file_path)
 
-            with patch("src.repositories.employee_repo.settings"):
-                repo = EmployeeRepository(file_path=custom_path)
+        monkeypatch.setattr(employee_repo_module, "_THREAD_READ_THRESHOLD_BYTES", 0)
 
-                # Act
-                result = await repo.get_all()
+        with patch.object(
+            employee_repo_module.asyncio, "to_thread", wraps=employee_repo_module.asyncio.to_thread
+        ) as mock_to_thread:
+            # Act
+            result = await repo.get_all()
 
         # Assert
-        assert repo.file_path == custom_path
+        mock_to_thread.assert_awaited_once()
         assert len(result) == len(sample_employee_data)
-        mock_aiofiles.open.assert_called_once_with(
-            custom_path, mode="r", encoding="utf-8"
-        )
+
+    @pytest.mark.asyncio
+    async def test_get_all_caches_until_file_changes(
+        self,
+        sample_employee_data: Tuple[Mapping[str, str], ...],
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+    ) -> None:
+        """Test that get_all() reuses parsed data until the file is modified.
+
+        Verifies that:
+        - Repeated calls do not re-read an unchanged file
+        - A rewrite is picked up even within the same mtime tick
+        """
+        # Arrange
+        file_path = write_employees_file(sample_employee_json)
+        repo = EmployeeRepository(file_path=file_path)
+
+        with patch.object(repo, "_read_file", wraps=repo._read_file) as mock_read:
+            # Act
+            first = await repo.get_all()
+            second = await repo.get_all()
+
+            # Keep the old mtime, as a coarse-timestamp filesystem would
+            original_stat = os.stat(file_path)
+            write_employees_file(json.dumps(sample_employee_data[:1], default=dict))
+            os.utime(file_path, ns=(original_stat.st_atime_ns, original_stat.st_mtime_ns))
+            reloaded = await repo.get_all()
+
+        # Assert
+        assert mock_read.call_count == 2
+        assert first == second
+        assert first is not second
+        assert len(reloaded) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_all_concurrent_calls_share_single_load(
+        self,
+        sample_employee_data: Tuple[Mapping[str, str], ...],
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that concurrent cold-cache callers trigger only one file read.
+
+        Verifies that:
+        - Callers waiting on an in-flight load reuse its result
+        - Every caller receives the full employee list
+        """
+        # Arrange
+        file_path = write_employees_file(sample_employee_json)
+        repo = EmployeeRepository(file_path=file_path)
+
+        monkeypatch.setattr(employee_repo_module, "_THREAD_READ_THRESHOLD_BYTES", 0)
+
+        with patch.object(repo, "_read_file", wraps=repo._read_file) as mock_read:
+            # Act
+            results = await asyncio.gather(*(repo.get_all() for _ in range(5)))
+
+        # Assert
+        assert mock_read.call_count == 1
+        assert all(len(result) == len(sample_employee_data) for result in results)
 
 
 class TestGetByName:
@@ -186,7 +311,11 @@ class TestGetByName:
 
     @pytest.mark.asyncio
     async def test_get_by_name_exact_match(
-        self, sample_employee_data: List[dict]
+        self,
+        sample_employee_data: Tuple[Mapping[str, str], ...],
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
     ) -> None:
         """Test that get_by_name() finds employee with exact name match.
 
@@ -196,25 +325,15 @@ class TestGetByName:
         - All employee attributes are populated
         """
         # Arrange
-        mock_file_content = json.dumps(sample_employee_data)
+        file_content = sample_employee_json
         search_name = sample_employee_data[0]["name"]
+        file_path = write_employees_file(file_content)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
-
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
-
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-                # Act
-                result = await repo.get_by_name(search_name)
+        # Act
+        result = await repo.get_by_name(search_name)
 
         # Assert
         assert result is not None
@@ -224,7 +343,11 @@ class TestGetByName:
 
     @pytest.mark.asyncio
     async def test_get_by_name_partial_match(
-        self, sample_employee_data: List[dict]
+        self,
+        sample_employee_data: Tuple[Mapping[str, str], ...],
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
     ) -> None:
         """Test that get_by_name() uses case-insensitive matching.
 
@@ -233,27 +356,17 @@ class TestGetByName:
         - Whitespace is trimmed during comparison
         """
         # Arrange
-        mock_file_content = json.dumps(sample_employee_data)
+        file_content = sample_employee_json
         # Use lowercase version of the name
         original_name = sample_employee_data[0]["name"]
         search_name = original_name.lower()
+        file_path = write_employees_file(file_content)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
-
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
-
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-                # Act
-                result = await repo.get_by_name(search_name)
+        # Act
+        result = await repo.get_by_name(search_name)
 
         # Assert
         assert result is not None
@@ -261,7 +374,11 @@ class TestGetByName:
 
     @pytest.mark.asyncio
     async def test_get_by_name_with_whitespace(
-        self, sample_employee_data: List[dict]
+        self,
+        sample_employee_data: Tuple[Mapping[str, str], ...],
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
     ) -> None:
         """Test that get_by_name() handles whitespace in search term.
 
@@ -270,26 +387,16 @@ class TestGetByName:
         - Employee is still found correctly
         """
         # Arrange
-        mock_file_content = json.dumps(sample_employee_data)
+        file_content = sample_employee_json
         original_name = sample_employee_data[1]["name"]
         search_name = f"  {original_name}  "  # Add whitespace
+        file_path = write_employees_file(file_content)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
-
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
-
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-                # Act
-                result = await repo.get_by_name(search_name)
+        # Act
+        result = await repo.get_by_name(search_name)
 
         # Assert
         assert result is not None
@@ -297,7 +404,10 @@ class TestGetByName:
 
     @pytest.mark.asyncio
     async def test_get_by_name_not_found(
-        self, sample_employee_data: List[dict]
+        self,
+        sample_employee_json: str,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
     ) -> None:
         """Test that get_by_name() returns None when employee not found.
 
@@ -306,31 +416,25 @@ class TestGetByName:
         - No exception is raised
         """
         # Arrange
-        mock_file_content = json.dumps(sample_employee_data)
+        file_content = sample_employee_json
         search_name = "Nonexistent Employee Name"
+        file_path = write_employees_file(file_content)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
-
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
-
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-                # Act
-                result = await repo.get_by_name(search_name)
+        # Act
+        result = await repo.get_by_name(search_name)
 
         # Assert
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_by_name_empty_database(self) -> None:
+    async def test_get_by_name_empty_database(
+        self,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that get_by_name() returns None when no employees exist.
 
         Verifies that:
@@ -338,31 +442,25 @@ class TestGetByName:
         - No exception is raised
         """
         # Arrange
-        mock_file_content = "[]"
+        file_content = "[]"
         search_name = "Any Name"
+        file_path = write_employees_file(file_content)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
-
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
-
-            mock_aiofiles.open.return_value = mock_open_cm
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
-
-                # Act
-                result = await repo.get_by_name(search_name)
+        # Act
+        result = await repo.get_by_name(search_name)
 
         # Assert
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_get_by_name_file_not_found_raises_error(self) -> None:
+    async def test_get_by_name_file_not_found_raises_error(
+        self,
+        tmp_path: Path,
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that get_by_name() raises error when file doesn't exist.
 
         Verifies that:
@@ -370,22 +468,44 @@ class TestGetByName:
         - Error can be handled by caller
         """
         # Arrange
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_aiofiles.open.side_effect = FileNotFoundError("File not found")
+        mock_settings.employees_file_path = str(tmp_path / "missing.json")
+        repo = EmployeeRepository()
+
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            await repo.get_by_name("Any Name")
 
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/nonexistent/path.json"
-                repo = EmployeeRepository()
+    @pytest.mark.asyncio
+    async def test_get_by_name_returns_first_duplicate(
+        self, write_employees_file: Callable[[str], str]
+    ) -> None:
+        """Test that the name index keeps the first employee for duplicate names.
 
-                # Act & Assert
-                with pytest.raises(FileNotFoundError):
-                    await repo.get_by_name("Any Name")
+        Verifies that:
+        - Duplicate names resolve to the first entry in the file
+        """
+        # Arrange
+        employee_data = [
+            {"id": "1", "name": "Same Name"},
+            {"id": "2", "name": "same name "},
+        ]
+        repo = EmployeeRepository(file_path=write_employees_file(json.dumps(employee_data)))
+
+        # Act
+        result = await repo.get_by_name("SAME NAME")
+
+        # Assert
+        assert result is not None
+        assert result.id == "1"
 
 
 class TestRepositoryInit:
     """Tests for EmployeeRepository initialization."""
 
-    def test_init_uses_settings_default(self) -> None:
+    def test_init_uses_settings_default(
+        self,
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that repository uses settings default file path.
 
         Verifies that:
@@ -393,14 +513,16 @@ class TestRepositoryInit:
         - Custom path parameter is optional
         """
         # Arrange & Act
-        with patch("src.repositories.employee_repo.settings") as mock_settings:
-            mock_settings.employees_file_path = "/default/path.json"
-            repo = EmployeeRepository()
+        mock_settings.employees_file_path = "/default/path.json"
+        repo = EmployeeRepository()
 
         # Assert
         assert repo.file_path == "/default/path.json"
 
-    def test_init_with_custom_path(self) -> None:
+    def test_init_with_custom_path(
+        self,
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that repository accepts custom file path.
 
         Verifies that:
@@ -410,8 +532,7 @@ class TestRepositoryInit:
         custom_path = "/custom/path.json"
 
         # Act
-        with patch("src.repositories.employee_repo.settings"):
-            repo = EmployeeRepository(file_path=custom_path)
+        repo = EmployeeRepository(file_path=custom_path)
 
         # Assert
         assert repo.file_path == custom_path
@@ -421,7 +542,11 @@ class TestEmployeeModel:
     """Tests for Employee model validation within repository context."""
 
     @pytest.mark.asyncio
-    async def test_employee_with_optional_department(self) -> None:
+    async def test_employee_with_optional_department(
+        self,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that employees without department are loaded correctly.
 
         Verifies that:
@@ -432,31 +557,25 @@ class TestEmployeeModel:
         employee_data = [
             {"id": "1", "name": "Test Employee", "department": None},
         ]
-        mock_file_content = json.dumps(employee_data)
-
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
+        file_content = json.dumps(employee_data)
+        file_path = write_employees_file(file_content)
 
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
-
-                # Act
-                result = await repo.get_all()
+        # Act
+        result = await repo.get_all()
 
         # Assert
         assert len(result) == 1
         assert result[0].department is None
 
     @pytest.mark.asyncio
-    async def test_employee_missing_required_field_raises_error(self) -> None:
+    async def test_employee_missing_required_field_raises_error(
+        self,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that missing required fields raise validation error.
 
         Verifies that:
@@ -467,28 +586,22 @@ class TestEmployeeModel:
         invalid_employee_data = [
             {"id": "1", "department": "IT"},  # Missing 'name'
         ]
-        mock_file_content = json.dumps(invalid_employee_data)
+        file_content = json.dumps(invalid_employee_data)
+        file_path = write_employees_file(file_content)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
-
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
-
-                # Act & Assert
-                with pytest.raises(Exception):  # Pydantic ValidationError
-                    await repo.get_all()
+        # Act & Assert
+        with pytest.raises(Exception):  # Pydantic ValidationError
+            await repo.get_all()
 
     @pytest.mark.asyncio
-    async def test_employee_data_with_all_fields(self) -> None:
+    async def test_employee_data_with_all_fields(
+        self,
+        write_employees_file: Callable[[str], str],
+        mock_settings: MagicMock,
+    ) -> None:
         """Test that employees with all fields are loaded correctly.
 
         Verifies that:
@@ -499,27 +612,38 @@ class TestEmployeeModel:
         employee_data = [
             {"id": "1", "name": "Full Employee", "department": "Engineering"},
         ]
-        mock_file_content = json.dumps(employee_data)
+        file_content = json.dumps(employee_data)
+        file_path = write_employees_file(file_content)
 
-        with patch("src.repositories.employee_repo.aiofiles") as mock_aiofiles:
-            mock_file = AsyncMock()
-            mock_file.read = AsyncMock(return_value=mock_file_content)
+        mock_settings.employees_file_path = file_path
+        repo = EmployeeRepository()
 
-            mock_open_cm = AsyncMock()
-            mock_open_cm.__aenter__.return_value = mock_file
-            mock_open_cm.__aexit__.return_value = None
-
-            mock_aiofiles.open.return_value = mock_open_cm
-
-            with patch("src.repositories.employee_repo.settings") as mock_settings:
-                mock_settings.employees_file_path = "/test/employees.json"
-                repo = EmployeeRepository()
-
-                # Act
-                result = await repo.get_all()
+        # Act
+        result = await repo.get_all()
 
         # Assert
         assert len(result) == 1
         assert result[0].id == "1"
         assert result[0].name == "Full Employee"
         assert result[0].department == "Engineering"
+
+    @pytest.mark.asyncio
+    async def test_employee_data_with_unknown_column(
+        self,
+        write_employees_file: Callable[[str], str],
+    ) -> None:
+        """Test that extra columns in the data file do not break loading.
+
+        Verifies that:
+        - Records with unknown keys are still loaded
+        - Known fields keep their values
+        """
+        # Arrange
+        employee_data = [{"id": "1", "name": "Full Employee", "position": "Lead"}]
+        repo = EmployeeRepository(file_path=write_employees_file(json.dumps(employee_data)))
+
+        # Act
+        result = await repo.get_all()
+
+        # Assert
+        assert [(employee.id, employee.name) for employee in result] == [("1", "Full Employee")]
@@ -14,6 +14,8 @@ Test coverage:
 
 import pytest
 import base64
+from types import SimpleNamespace
+from typing import Any, Awaitable, Callable
 from unittest.mock import patch, MagicMock, AsyncMock
 import httpx
 
@@ -21,9 +23,6 @@ from src.integrations.gemini import (
     GeminiClient,
     TEXT_STYLE_PROMPTS,
     IMAGE_STYLE_PROMPTS,
-    HTTP_TIMEOUT_SECONDS,
-    TEXT_MAX_TOKENS,
-    IMAGE_MAX_TOKENS,
     VisualConcept,
 )
 from src.integrations.exceptions import (
@@ -33,6 +32,50 @@ from src.integrations.exceptions import (
     GeminiConfigError,
 )
 
+# Minimal valid PNG (1x1 transparent pixel) shared by the image tests
+_MINIMAL_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
+    b"\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+    b"\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01"
+    b"\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+_MINIMAL_PNG_BASE64 = base64.b64encode(_MINIMAL_PNG).decode("utf-8")
+
+
+def _ok_response(payload: dict) -> MagicMock:
+    """Build a successful HTTP response mock whose ``json()`` returns ``payload``.
+
+    ``raise_for_status`` is left as the auto-created child mock, a no-op call.
+    """
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+def _fake_get_client(response: MagicMock) -> Callable[[], Awaitable[SimpleNamespace]]:
+    """Build a plain coroutine stand-in for ``_get_client``.
+
+    The returned client's ``post`` always resolves to ``response``. Tests that
+    do not assert on the HTTP call use this instead of nested AsyncMocks.
+    """
+
+    async def post(*args: Any, **kwargs: Any) -> MagicMock:
+        return response
+
+    client = SimpleNamespace(post=post)
+
+    async def get_client() -> SimpleNamespace:
+        return client
+
+    return get_client
+
+
+@pytest.fixture
+def gemini_client() -> GeminiClient:
+    """Create a GeminiClient instance for testing."""
+    return GeminiClient(api_key="test-api-key")
+
 
 class TestGeminiClientInit:
     """Tests for GeminiClient initialization."""
@@ -96,11 +139,6 @@ class TestGeminiClientInit:
 class TestGenerateTextStyles:
     """Tests for text generation with different styles."""
 
-    @pytest.fixture
-    def gemini_client(self) -> GeminiClient:
-        """Create a GeminiClient instance for testing."""
-        return GeminiClient(api_key="test-api-key")
-
     @pytest.fixture
     def mock_text_response(self) -> dict:
         """Create a mock successful text generation response."""
@@ -124,10 +162,7 @@ class TestGenerateTextStyles:
             "О, великий Иван Петров! В сей день предновогодний..."
         )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_text_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _ok_response(mock_text_response)
 
         with patch.object(gemini_client, "_get_client") as mock_get_client:
             mock_client = AsyncMock()
@@ -154,70 +189,55 @@ class TestGenerateTextStyles:
 
     @pytest.mark.asyncio
     async def test_generate_text_with_haiku_style(
-        self, gemini_client: GeminiClient, mock_text_response: dict
+        self, gemini_client: GeminiClient, mock_text_response: dict, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test text generation using 'haiku' (Japanese poetry) style."""
         mock_text_response["choices"][0]["message"]["content"] = (
             "Снег кружит над крышей\nИванов — как маяк —\nСветит сквозь метель"
         )
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_text_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _ok_response(mock_text_response)
 
-        with patch.object(gemini_client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
-
-            result = await gemini_client.generate_text(
-                prompt="",
-                style="haiku",
-                recipient="Иванов Иван",
-                reason="креативный подход",
-            )
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        result = await gemini_client.generate_text(
+            prompt="",
+            style="haiku",
+            recipient="Иванов Иван",
+            reason="креативный подход",
+        )
 
-            assert isinstance(result, str)
-            assert len(result) > 0
+        assert isinstance(result, str)
+        assert len(result) > 0
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("style", list(TEXT_STYLE_PROMPTS))
     async def test_generate_text_with_all_styles(
-        self, gemini_client: GeminiClient, mock_text_response: dict
+        self,
+        gemini_client: GeminiClient,
+        mock_text_response: dict,
+        monkeypatch: pytest.MonkeyPatch,
+        style: str,
     ) -> None:
-        """Test that all text styles can be used without error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_text_response
-        mock_response.raise_for_status = MagicMock()
-
-        for style in TEXT_STYLE_PROMPTS.keys():
-            with patch.object(gemini_client, "_get_client") as mock_get_client:
-                mock_client = AsyncMock()
-                mock_client.post = AsyncMock(return_value=mock_response)
-                mock_get_client.return_value = mock_client
-
-                result = await gemini_client.generate_text(
-                    prompt="",
-                    style=style,
-                    recipient="Test User",
-                    reason="testing",
-                )
+        """Test that every text style can be used without error."""
+        mock_response = _ok_response(mock_text_response)
+
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        result = await gemini_client.generate_text(
+            prompt="",
+            style=style,
+            recipient="Test User",
+            reason="testing",
+        )
 
-                assert isinstance(result, str)
+        assert isinstance(result, str)
 
 
 class TestGenerateTextErrors:
     """Tests for error handling in text generation."""
 
-    @pytest.fixture
-    def gemini_client(self) -> GeminiClient:
-        """Create a GeminiClient instance for testing."""
-        return GeminiClient(api_key="test-api-key")
-
     @pytest.mark.asyncio
     async def test_generate_text_handles_api_error(
-        self, gemini_client: GeminiClient
+        self, gemini_client: GeminiClient, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that API errors are properly caught and wrapped."""
         mock_response = MagicMock()
@@ -228,41 +248,33 @@ class TestGenerateTextErrors:
             response=mock_response,
         )
 
-        with patch.object(gemini_client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
-
-            with pytest.raises(GeminiTextGenerationError) as exc_info:
-                await gemini_client.generate_text(
-                    prompt="",
-                    style="ode",
-                    recipient="Test User",
-                    reason="testing",
-                )
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        with pytest.raises(GeminiTextGenerationError) as exc_info:
+            await gemini_client.generate_text(
+                prompt="",
+                style="ode",
+                recipient="Test User",
+                reason="testing",
+            )
 
-            assert exc_info.value.original_error is not None
+        assert exc_info.value.original_error is not None
 
     @pytest.mark.asyncio
     async def test_generate_text_raises_rate_limit_error(
-        self, gemini_client: GeminiClient
+        self, gemini_client: GeminiClient, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that rate limit errors are properly identified and raised."""
         mock_response = MagicMock()
         mock_response.status_code = 429
 
-        with patch.object(gemini_client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
-
-            with pytest.raises(GeminiRateLimitError):
-                await gemini_client.generate_text(
-                    prompt="",
-                    style="ode",
-                    recipient="Test User",
-                    reason="testing",
-                )
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        with pytest.raises(GeminiRateLimitError):
+            await gemini_client.generate_text(
+                prompt="",
+                style="ode",
+                recipient="Test User",
+                reason="testing",
+            )
 
     @pytest.mark.asyncio
     async def test_generate_text_invalid_style_raises_error(
@@ -282,38 +294,26 @@ class TestGenerateTextErrors:
 
     @pytest.mark.asyncio
     async def test_generate_text_empty_response_raises_error(
-        self, gemini_client: GeminiClient
+        self, gemini_client: GeminiClient, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test that empty API response raises GeminiTextGenerationError."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"choices": []}
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _ok_response({"choices": []})
 
-        with patch.object(gemini_client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
-
-            with pytest.raises(GeminiTextGenerationError) as exc_info:
-                await gemini_client.generate_text(
-                    prompt="",
-                    style="ode",
-                    recipient="Test User",
-                    reason="testing",
-                )
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        with pytest.raises(GeminiTextGenerationError) as exc_info:
+            await gemini_client.generate_text(
+                prompt="",
+                style="ode",
+                recipient="Test User",
+                reason="testing",
+            )
 
-            assert "пустой" in str(exc_info.value).lower()
+        assert "пустой" in str(exc_info.value).lower()
 
 
 class TestGenerateImage:
     """Tests for image generation functionality."""
 
-    @pytest.fixture
-    def gemini_client(self) -> GeminiClient:
-        """Create a GeminiClient instance for testing."""
-        return GeminiClient(api_key="test-api-key")
-
     @pytest.fixture
     def sample_visual_concept(self) -> VisualConcept:
         """Create a sample VisualConcept for testing."""
@@ -327,13 +327,7 @@ class TestGenerateImage:
     @pytest.fixture
     def mock_image_response(self) -> dict:
         """Create a mock successful image generation response with base64 PNG."""
-        # Create a minimal valid PNG (1x1 transparent pixel)
-        png_data = base64.b64encode(
-            b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
-            b"\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
-            b"\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01"
-            b"\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
-        ).decode("utf-8")
+        png_data = _MINIMAL_PNG_BASE64
 
         return {
             "choices": [
@@ -347,62 +341,57 @@ class TestGenerateImage:
 
     @pytest.mark.asyncio
     async def test_generate_image_returns_tuple(
-        self, gemini_client: GeminiClient, mock_image_response: dict, sample_visual_concept: VisualConcept
+        self,
+        gemini_client: GeminiClient,
+        mock_image_response: dict,
+        sample_visual_concept: VisualConcept,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that image generation returns tuple of (bytes, prompt).
 
         NEW architecture: generate_image accepts VisualConcept and returns Tuple[bytes, str].
         """
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_image_response
-        mock_response.raise_for_status = MagicMock()
+        mock_response = _ok_response(mock_image_response)
 
-        with patch.object(gemini_client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
-
-            result = await gemini_client.generate_image(
-                visual_concept=sample_visual_concept,
-                style="knitted",
-            )
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        result = await gemini_client.generate_image(
+            visual_concept=sample_visual_concept,
+            style="knitted",
+        )
 
-            # Verify tuple structure
-            assert isinstance(result, tuple)
-            assert len(result) == 2
+        # Verify tuple structure
+        assert isinstance(result, tuple)
+        assert len(result) == 2
 
-            image_bytes, prompt = result
-            assert isinstance(image_bytes, bytes)
-            assert image_bytes[:4] == b"\x89PNG"  # PNG magic bytes
-            assert isinstance(prompt, str)
-            assert len(prompt) > 0
+        image_bytes, prompt = result
+        assert isinstance(image_bytes, bytes)
+        assert image_bytes[:4] == b"\x89PNG"  # PNG magic bytes
+        assert isinstance(prompt, str)
+        assert len(prompt) > 0
 
     @pytest.mark.asyncio
+    @pytest.mark.parametrize("style", list(IMAGE_STYLE_PROMPTS))
     async def test_generate_image_with_all_styles(
-        self, gemini_client: GeminiClient, mock_image_response: dict, sample_visual_concept: VisualConcept
+        self,
+        gemini_client: GeminiClient,
+        mock_image_response: dict,
+        sample_visual_concept: VisualConcept,
+        monkeypatch: pytest.MonkeyPatch,
+        style: str,
     ) -> None:
-        """Test that all image styles can be used without error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = mock_image_response
-        mock_response.raise_for_status = MagicMock()
-
-        for style in IMAGE_STYLE_PROMPTS.keys():
-            with patch.object(gemini_client, "_get_client") as mock_get_client:
-                mock_client = AsyncMock()
-                mock_client.post = AsyncMock(return_value=mock_response)
-                mock_get_client.return_value = mock_client
-
-                result = await gemini_client.generate_image(
-                    visual_concept=sample_visual_concept,
-                    style=style,
-                )
-
-                # Verify result is tuple (bytes, str)
-                assert isinstance(result, tuple)
-                image_bytes, prompt = result
-                assert isinstance(image_bytes, bytes)
+        """Test that every image style can be used without error."""
+        mock_response = _ok_response(mock_image_response)
+
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        result = await gemini_client.generate_image(
+            visual_concept=sample_visual_concept,
+            style=style,
+        )
+
+        # Verify result is tuple (bytes, str)
+        assert isinstance(result, tuple)
+        image_bytes, prompt = result
+        assert isinstance(image_bytes, bytes)
 
     @pytest.mark.asyncio
     async def test_generate_image_invalid_style_raises_error(
@@ -419,63 +408,47 @@ class TestGenerateImage:
 
     @pytest.mark.asyncio
     async def test_generate_image_handles_rate_limit(
-        self, gemini_client: GeminiClient, sample_visual_concept: VisualConcept
+        self,
+        gemini_client: GeminiClient,
+        sample_visual_concept: VisualConcept,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that rate limit is properly handled for image generation."""
         mock_response = MagicMock()
         mock_response.status_code = 429
 
-        with patch.object(gemini_client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
-
-            with pytest.raises(GeminiRateLimitError):
-                await gemini_client.generate_image(
-                    visual_concept=sample_visual_concept,
-                    style="knitted",
-                )
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        with pytest.raises(GeminiRateLimitError):
+            await gemini_client.generate_image(
+                visual_concept=sample_visual_concept,
+                style="knitted",
+            )
 
     @pytest.mark.asyncio
     async def test_generate_image_empty_response_raises_error(
-        self, gemini_client: GeminiClient, sample_visual_concept: VisualConcept
+        self,
+        gemini_client: GeminiClient,
+        sample_visual_concept: VisualConcept,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test that empty response raises appropriate error."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"choices": []}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch.object(gemini_client, "_get_client") as mock_get_client:
-            mock_client = AsyncMock()
-            mock_client.post = AsyncMock(return_value=mock_response)
-            mock_get_client.return_value = mock_client
+        mock_response = _ok_response({"choices": []})
 
-            with pytest.raises(GeminiImageGenerationError):
-                await gemini_client.generate_image(
-                    visual_concept=sample_visual_concept,
-                    style="knitted",
-                )
+        monkeypatch.setattr(gemini_client, "_get_client", _fake_get_client(mock_response))
+        with pytest.raises(GeminiImageGenerationError):
+            await gemini_client.generate_image(
+                visual_concept=sample_visual_concept,
+                style="knitted",
+            )
 
 
 class TestExtractImageFromResponse:
     """Tests for _extract_image_from_response method."""
 
-    @pytest.fixture
-    def gemini_client(self) -> GeminiClient:
-        """Create a GeminiClient instance for testing."""
-        return GeminiClient(api_key="test-api-key")
-
     def test_extract_base64_png_direct(self, gemini_client: GeminiClient) -> None:
         """Test extraction of direct base64 PNG data."""
-        # Minimal PNG data
-        png_bytes = (
-            b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
-            b"\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
-            b"\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01"
-            b"\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
-        )
-        base64_data = base64.b64encode(png_bytes).decode("utf-8")
+        png_bytes = _MINIMAL_PNG
+        base64_data = _MINIMAL_PNG_BASE64
 
         data = {
             "choices": [
@@ -492,13 +465,8 @@ class TestExtractImageFromResponse:
 
     def test_extract_base64_with_data_uri(self, gemini_client: GeminiClient) -> None:
         """Test extraction of base64 PNG with data URI prefix."""
-        png_bytes = (
-            b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
-            b"\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
-            b"\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01"
-            b"\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
-        )
-        base64_data = base64.b64encode(png_bytes).decode("utf-8")
+        png_bytes = _MINIMAL_PNG
+        base64_data = _MINIMAL_PNG_BASE64
 
         data = {
             "choices": [
@@ -539,11 +507,6 @@ class TestExtractImageFromResponse:
 class TestClientLifecycle:
     """Tests for client lifecycle management."""
 
-    @pytest.fixture
-    def gemini_client(self) -> GeminiClient:
-        """Create a GeminiClient instance for testing."""
-        return GeminiClient(api_key="test-api-key")
-
     @pytest.mark.asyncio
     async def test_close_client(self, gemini_client: GeminiClient) -> None:
         """Test that close() method completes without error."""
@@ -583,10 +546,11 @@ class TestTextStylePrompts:
 
     def test_all_styles_have_prompts(self) -> None:
         """Test that all expected styles have associated prompts."""
-        expected_styles = ["ode", "future", "haiku", "newspaper", "standup"]
+        expected_styles = {"ode", "future", "haiku", "newspaper", "standup"}
 
+        missing = expected_styles - TEXT_STYLE_PROMPTS.keys()
+        assert not missing, f"Missing styles: {sorted(missing)}"
         for style in expected_styles:
-            assert style in TEXT_STYLE_PROMPTS, f"Missing style: {style}"
             prompt = TEXT_STYLE_PROMPTS[style]
             assert "{recipient}" in prompt, f"Missing {{recipient}} in {style}"
             assert "{reason}" in prompt, f"Missing {{reason}} in {style}"
@@ -605,10 +569,11 @@ class TestImageStylePrompts:
     def test_all_image_styles_have_prompts(self) -> None:
         """Test that all expected image styles have associated prompts."""
         # Updated to check for new visual concept placeholders
-        expected_styles = ["knitted", "pixel_art", "watercolor", "hyperrealism"]
+        expected_styles = {"knitted", "pixel_art", "watercolor", "hyperrealism"}
 
+        missing = expected_styles - IMAGE_STYLE_PROMPTS.keys()
+        assert not missing, f"Missing image styles: {sorted(missing)}"
         for style in expected_styles:
-            assert style in IMAGE_STYLE_PROMPTS, f"Missing image style: {style}"
             prompt = IMAGE_STYLE_PROMPTS[style]
             # New architecture: each style REINTERPRETS the theme creatively
             # Required placeholders: core_theme, visual_metaphor, mood
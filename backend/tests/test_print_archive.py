@@ -53,9 +53,7 @@ def test_build_zip_contains_png_and_manifest(tmp_path) -> None:
     zip_bytes = store.build_zip_bytes()
 
     with ZipFile(BytesIO(zip_bytes)) as archive:
-        names = archive.namelist()
-        assert asset.filename in names
-        assert "manifest.csv" in names
+        assert {asset.filename, "manifest.csv"} <= set(archive.namelist())
 
         manifest = archive.read("manifest.csv").decode("utf-8-sig")
         assert "Captain of a flying bookshop" in manifest
@@ -1,43 +1,57 @@
 """Endpoint tests for the protected print archive API."""
 
-from fastapi.testclient import TestClient
+import orjson
+import pytest
+from httpx import AsyncClient
 
-from src.api import dependencies
+from src.api.dependencies import get_print_archive_store
+from src.api.print_assets import PrintArchiveAuthStatusResponse
 from src.config import settings
-from src.main import app
+from src.core.print_archive import PrintArchiveStore
+from src.models import APIResponse, PrintArchiveListResponse
 
+# Run on the session event loop that owns the shared ASGI client, and keep
+# every test using that client on one xdist worker
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.xdist_group("api")]
 
-def test_print_archive_auth_and_empty_list(tmp_path) -> None:
-    original_storage_path = settings.print_archive_storage_path
-    object.__setattr__(settings, "print_archive_storage_path", str(tmp_path / "print-archive"))
-    dependencies._print_archive_store = None
+_JSON_HEADERS = {"content-type": "application/json"}
+_AuthStatusEnvelope = APIResponse[PrintArchiveAuthStatusResponse]
+_AssetListEnvelope = APIResponse[PrintArchiveListResponse]
 
-    try:
-        client = TestClient(app)
 
-        status_response = client.get("/api/v1/print-assets/auth/status")
-        assert status_response.status_code == 200
-        assert status_response.json()["data"]["authenticated"] is False
+@pytest.fixture
+def isolated_print_archive(tmp_path, override_dependency) -> None:
+    """Serve an empty per-test print archive to the running app."""
+    override_dependency(
+        get_print_archive_store,
+        PrintArchiveStore(storage_path=str(tmp_path / "print-archive")),
+    )
 
-        verify_response = client.post(
-            "/api/v1/print-assets/auth/verify",
-            json={"password": settings.print_archive_password},
-        )
-        assert verify_response.status_code == 200
-        assert verify_response.json()["data"]["authenticated"] is True
 
-        assets_response = client.get("/api/v1/print-assets/assets")
-        assert assets_response.status_code == 200
-        assert assets_response.json()["data"]["assets"] == []
-    finally:
-        object.__setattr__(settings, "print_archive_storage_path", original_storage_path)
-        dependencies._print_archive_store = None
+@pytest.mark.usefixtures("isolated_print_archive")
+async def test_print_archive_auth_and_empty_list(client: AsyncClient) -> None:
+    status_response = await client.get("/api/v1/print-assets/auth/status")
+    assert status_response.status_code == 200
+    status = _AuthStatusEnvelope.model_validate_json(status_response.content).data
+    assert status.authenticated is False
 
+    verify_response = await client.post(
+        "/api/v1/print-assets/auth/verify",
+        content=orjson.dumps({"password": settings.print_archive_password}),
+        headers=_JSON_HEADERS,
+    )
+    assert verify_response.status_code == 200
+    verified = _AuthStatusEnvelope.model_validate_json(verify_response.content).data
+    assert verified.authenticated is True
 
-def test_print_archive_assets_requires_authentication() -> None:
-    client = TestClient(app)
+    assets_response = await client.get("/api/v1/print-assets/assets")
+    assert assets_response.status_code == 200
+    assert _AssetListEnvelope.model_validate_json(assets_response.content).data.assets == []
 
-    response = client.get("/api/v1/print-assets/assets")
+
+@pytest.mark.usefixtures("isolated_print_archive")
+async def test_print_archive_assets_requires_authentication(client: AsyncClient) -> None:
+    response = await client.get("/api/v1/print-assets/assets")
 
     assert response.status_code == 401
-    assert response.json()["detail"] == "Print archive authentication required"
+    assert orjson.loads(response.content)["detail"] == "Print archive authentication required"
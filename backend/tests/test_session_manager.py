@@ -1,9 +1,21 @@
 """Unit tests for the photocard SessionManager."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 import uuid
 
+import pytest
+
 from src.core.session_manager import GenerationSession, SessionManager
+from src.models.card import ImageStyle
+from src.models.photocard import PhotocardImageVariant
+
+
+@pytest.fixture(scope="session")
+def sample_image_styles(
+    _sample_image_variants_ro: tuple[PhotocardImageVariant, ...],
+) -> tuple[ImageStyle, ...]:
+    """Return the styles of the sample variants, in order, once per session."""
+    return tuple(variant.style for variant in _sample_image_variants_ro)
 
 
 class TestSessionManager:
@@ -12,6 +24,7 @@ class TestSessionManager:
     def test_create_session_returns_uuid(
         self,
         sample_image_variants,
+        sample_image_styles,
         sample_image_data,
     ) -> None:
         manager = SessionManager(session_ttl_minutes=30)
@@ -21,7 +34,7 @@ class TestSessionManager:
             alter_ego="Cyber captain",
             image_variants=sample_image_variants,
             image_data=sample_image_data,
-            generated_styles=[variant.style for variant in sample_image_variants],
+            generated_styles=sample_image_styles,
         )
 
         assert str(uuid.UUID(session_id)) == session_id
@@ -29,6 +42,7 @@ class TestSessionManager:
     def test_create_session_stores_photocard_payload(
         self,
         sample_image_variants,
+        sample_image_styles,
         sample_image_data,
     ) -> None:
         manager = SessionManager(session_ttl_minutes=30)
@@ -37,7 +51,7 @@ class TestSessionManager:
             alter_ego="Cyber captain",
             image_variants=sample_image_variants,
             image_data=sample_image_data,
-            generated_styles=[variant.style for variant in sample_image_variants],
+            generated_styles=sample_image_styles,
         )
 
         session = manager.get_session(session_id)
@@ -48,12 +62,14 @@ class TestSessionManager:
         assert session.alter_ego == "Cyber captain"
         assert session.image_variants == sample_image_variants
         assert session.image_data == sample_image_data
-        assert session.generated_styles == [variant.style for variant in sample_image_variants]
+        assert tuple(session.generated_styles) == sample_image_styles
 
     def test_get_session_returns_none_for_expired_session(
         self,
         sample_image_variants,
+        sample_image_styles,
         sample_image_data,
+        session_now: datetime,
     ) -> None:
         manager = SessionManager(session_ttl_minutes=1)
         session_id = manager.create_session(
@@ -61,10 +77,10 @@ class TestSessionManager:
             alter_ego="Cyber captain",
             image_variants=sample_image_variants,
             image_data=sample_image_data,
-            generated_styles=[variant.style for variant in sample_image_variants],
+            generated_styles=sample_image_styles,
         )
 
-        manager._sessions[session_id].created_at = datetime.now(timezone.utc) - timedelta(minutes=2)
+        manager._sessions[session_id].created_at = session_now - timedelta(minutes=2)
 
         assert manager.get_session(session_id) is None
         assert session_id not in manager._sessions
@@ -72,6 +88,7 @@ class TestSessionManager:
     def test_get_image_data_returns_bytes(
         self,
         sample_image_variants,
+        sample_image_styles,
         sample_image_data,
     ) -> None:
         manager = SessionManager(session_ttl_minutes=30)
@@ -80,7 +97,7 @@ class TestSessionManager:
             alter_ego="Cyber captain",
             image_variants=sample_image_variants,
             image_data=sample_image_data,
-            generated_styles=[variant.style for variant in sample_image_variants],
+            generated_styles=sample_image_styles,
         )
 
         first_variant = sample_image_variants[0]
@@ -90,7 +107,9 @@ class TestSessionManager:
     def test_cleanup_expired_removes_only_expired_sessions(
         self,
         sample_image_variants,
+        sample_image_styles,
         sample_image_data,
+        session_now: datetime,
     ) -> None:
         manager = SessionManager(session_ttl_minutes=30)
         active_session_id = manager.create_session(
@@ -98,18 +117,16 @@ class TestSessionManager:
             alter_ego="Cyber captain",
             image_variants=sample_image_variants,
             image_data=sample_image_data,
-            generated_styles=[variant.style for variant in sample_image_variants],
+            generated_styles=sample_image_styles,
         )
         expired_session_id = manager.create_session(
             full_name="John Snow",
             alter_ego="Fantasy ranger",
             image_variants=sample_image_variants,
             image_data=sample_image_data,
-            generated_styles=[variant.style for variant in sample_image_variants],
-        )
-        manager._sessions[expired_session_id].created_at = (
-            datetime.now(timezone.utc) - timedelta(minutes=31)
+            generated_styles=sample_image_styles,
         )
+        manager._sessions[expired_session_id].created_at = session_now - timedelta(minutes=31)
 
         removed_count = manager.cleanup_expired()
 
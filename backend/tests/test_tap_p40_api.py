@@ -1,55 +1,150 @@
 """Endpoint tests for the Tap the P4.0 API."""
 
-from fastapi.testclient import TestClient
-
-from src.api import dependencies
-from src.config import settings
-from src.main import app
-
-
-def test_tap_p40_api_saves_score_and_returns_leaderboard(tmp_path) -> None:
-    original_path = settings.tap_p40_leaderboard_path
-    object.__setattr__(settings, "tap_p40_leaderboard_path", str(tmp_path / "tap-p40.json"))
-    dependencies._tap_p40_leaderboard_store = None
-
-    try:
-        client = TestClient(app)
-
-        save_response = client.post(
-            "/api/v1/tap-p40/scores",
-            json={
-                "player_name": "Катя",
-                "score": 12,
-                "correct_taps": 12,
-                "wrong_taps": 1,
-                "duration_ms": 25000,
-            },
-        )
-        assert save_response.status_code == 200
-        assert save_response.json()["data"]["rank"] == 1
-        assert save_response.json()["data"]["personal_best"] is True
-
-        leaderboard_response = client.get("/api/v1/tap-p40/leaderboard?period=all&limit=20")
-        assert leaderboard_response.status_code == 200
-        assert leaderboard_response.json()["data"]["entries"][0]["player_name"] == "Катя"
-        assert leaderboard_response.json()["data"]["entries"][0]["score"] == 12
-    finally:
-        object.__setattr__(settings, "tap_p40_leaderboard_path", original_path)
-        dependencies._tap_p40_leaderboard_store = None
-
-
-def test_tap_p40_api_validates_payload() -> None:
-    client = TestClient(app)
-
-    response = client.post(
-        "/api/v1/tap-p40/scores",
-        json={
-            "player_name": "",
-            "score": -1,
-            "correct_taps": 0,
-            "wrong_taps": 0,
-            "duration_ms": 1000,
-        },
+import asyncio
+
+import orjson
+import pytest
+from httpx import AsyncClient, Response
+
+from src.api.dependencies import get_tap_p40_leaderboard_store
+from src.api.tap_p40 import get_tap_p40_leaderboard
+from src.core.tap_p40_leaderboard import TapP40LeaderboardStore
+from src.models import APIResponse
+from src.models.tap_p40 import TapP40LeaderboardResponse, TapP40ScoreResponse
+
+# Run on the session event loop that owns the shared ASGI client, and keep
+# every test using that client on one xdist worker
+pytestmark = [pytest.mark.asyncio(loop_scope="session"), pytest.mark.xdist_group("api")]
+
+_SCORES_URL = "/api/v1/tap-p40/scores"
+_LEADERBOARD_URL = "/api/v1/tap-p40/leaderboard"
+_ALL_TIME_QUERY = {"period": "all", "limit": 20}
+_VALID_SCORE_PAYLOAD = {
+    "player_name": "Катя",
+    "score": 12,
+    "correct_taps": 12,
+    "wrong_taps": 1,
+    "duration_ms": 25000,
+}
+_VALID_SCORE_BODY = orjson.dumps(_VALID_SCORE_PAYLOAD)
+_JSON_HEADERS = {"content-type": "application/json"}
+_CONCURRENT_PLAYERS = tuple(f"Player {i}" for i in range(5))
+_CONCURRENT_SCORE_BODIES = tuple(
+    orjson.dumps({**_VALID_SCORE_PAYLOAD, "player_name": name, "score": score})
+    for score, name in enumerate(_CONCURRENT_PLAYERS)
+)
+# Parametrized envelopes are BaseModels, so their own compiled validators are used directly
+_ScoreEnvelope = APIResponse[TapP40ScoreResponse]
+_LeaderboardEnvelope = APIResponse[TapP40LeaderboardResponse]
+
+
+async def _post_json(client: AsyncClient, url: str, body: bytes) -> Response:
+    """POST pre-serialized JSON bytes, skipping per-call payload encoding."""
+    return await client.post(url, content=body, headers=_JSON_HEADERS)
+
+
+@pytest.fixture
+def isolated_leaderboard(tmp_path, override_dependency) -> None:
+    """Serve an empty per-test leaderboard store to the running app.
+
+    The override leaves the settings and the app's singleton store alone, so
+    nothing the session lifespan manages is torn down or rebuilt per test.
+    """
+    store = TapP40LeaderboardStore(str(tmp_path / "tap-p40.json"))
+    override_dependency(get_tap_p40_leaderboard_store, store)
+
+
+@pytest.mark.usefixtures("isolated_leaderboard")
+async def test_tap_p40_api_saves_score_and_returns_leaderboard(client: AsyncClient) -> None:
+    save_response = await _post_json(client, _SCORES_URL, _VALID_SCORE_BODY)
+    assert save_response.status_code == 200
+    saved = _ScoreEnvelope.model_validate_json(save_response.content).data
+    assert saved.rank == 1
+    assert saved.personal_best is True
+
+    leaderboard_response = await client.get(_LEADERBOARD_URL, params=_ALL_TIME_QUERY)
+    assert leaderboard_response.status_code == 200
+    leaderboard = _LeaderboardEnvelope.model_validate_json(leaderboard_response.content).data
+    assert leaderboard.entries[0].player_name == "Катя"
+    assert leaderboard.entries[0].score == 12
+
+
+@pytest.mark.usefixtures("isolated_leaderboard")
+async def test_tap_p40_api_keeps_every_concurrent_score(client: AsyncClient) -> None:
+    """Verifies that:
+    - Score submissions issued concurrently all succeed
+    - None of them is lost from the leaderboard
+    """
+    # Act
+    responses = await asyncio.gather(
+        *(_post_json(client, _SCORES_URL, body) for body in _CONCURRENT_SCORE_BODIES)
     )
+    leaderboard_response = await client.get(_LEADERBOARD_URL, params=_ALL_TIME_QUERY)
+
+    # Assert
+    assert [response.status_code for response in responses] == [200] * len(_CONCURRENT_PLAYERS)
+    leaderboard = _LeaderboardEnvelope.model_validate_json(leaderboard_response.content).data
+    assert {entry.player_name for entry in leaderboard.entries} == set(_CONCURRENT_PLAYERS)
+
+
+async def test_tap_p40_leaderboard_handler_echoes_query_in_envelope(tmp_path) -> None:
+    """Verifies that:
+    - The handler wraps the store's entries in a successful envelope
+    - The requested period and limit are echoed back
+    """
+    # Arrange
+    store = TapP40LeaderboardStore(str(tmp_path / "tap-p40.json"))
+
+    # Act
+    response = await get_tap_p40_leaderboard(store=store, period="day", limit=5)
+
+    # Assert
+    assert response.success is True
+    assert response.error is None
+    assert response.data is not None
+    assert (response.data.period, response.data.limit) == ("day", 5)
+    assert response.data.entries == []
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        orjson.dumps({**_VALID_SCORE_PAYLOAD, **overrides})
+        for overrides in (
+            {"player_name": "", "score": -1, "duration_ms": 1000},
+            {"player_name": ""},
+            {"score": -1},
+            {"duration_ms": 1000},
+            {"game_version": ""},
+        )
+    ],
+    ids=["all-invalid", "empty-name", "negative-score", "short-duration", "empty-version"],
+)
+@pytest.mark.usefixtures("isolated_leaderboard")
+async def test_tap_p40_api_validates_payload(client: AsyncClient, body: bytes) -> None:
+    response = await _post_json(client, _SCORES_URL, body)
 
     assert response.status_code == 422
+    assert "detail" in orjson.loads(response.content)
+
+
+@pytest.mark.usefixtures("isolated_leaderboard")
+@pytest.mark.parametrize("limit", [0, 1, 100, 101], ids=lambda limit: f"limit-{limit}")
+@pytest.mark.parametrize("period", ["all", "day", "week"])
+async def test_tap_p40_api_validates_leaderboard_query(
+    client: AsyncClient,
+    period: str,
+    limit: int,
+) -> None:
+    """Verifies that:
+    - Every period/limit pair is checked independently
+    - Only known periods with a limit in 1..100 are accepted
+    """
+    # Arrange
+    expected_status = 200 if period in ("all", "day") and 1 <= limit <= 100 else 422
+
+    # Act
+    response = await client.get(_LEADERBOARD_URL, params={"period": period, "limit": limit})
+
+    # Assert
+    assert response.status_code == expected_status
@@ -1,7 +1,12 @@
 """Unit tests for Tap the P4.0 leaderboard storage."""
 
-import json
 from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import orjson
+from hypothesis import example, given, settings
+from hypothesis import strategies as st
 
 from src.core.tap_p40_leaderboard import TapP40LeaderboardStore
 from src.models.tap_p40 import TapP40ScoreRequest
@@ -86,9 +91,9 @@ def test_tap_p40_store_filters_daily_period_and_limit(tmp_path) -> None:
         )
     )
 
-    payload = json.loads(leaderboard_path.read_text(encoding="utf-8"))
+    payload = orjson.loads(leaderboard_path.read_bytes())
     payload[0]["created_at"] = (datetime.now(timezone.utc) - timedelta(days=2)).isoformat()
-    leaderboard_path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    leaderboard_path.write_bytes(orjson.dumps(payload))
 
     store.save_score(
         TapP40ScoreRequest(
@@ -106,3 +111,34 @@ def test_tap_p40_store_filters_daily_period_and_limit(tmp_path) -> None:
     assert [entry.player_name for entry in day_entries] == ["Сейчас"]
     assert len(all_entries) == 1
     assert all_entries[0].player_name == "Сейчас"
+
+
+@settings(max_examples=25, deadline=None)
+@given(
+    player_name=st.text(
+        alphabet=st.characters(whitelist_categories=("L", "N", "P", "S")),
+        min_size=1,
+        max_size=80,
+    )
+)
+@example(player_name="Иванов Иван Иванович")
+@example(player_name="John O'Connor-Smith")
+@example(player_name="Ёлка 🎄 <b>&amp;</b>")
+def test_tap_p40_store_round_trips_player_name(player_name: str) -> None:
+    # Hypothesis reruns the body per example, so each run gets its own file
+    # instead of sharing the function-scoped tmp_path
+    with TemporaryDirectory() as storage_dir:
+        leaderboard_path = str(Path(storage_dir) / "tap-p40.json")
+        saved = TapP40LeaderboardStore(leaderboard_path).save_score(
+            TapP40ScoreRequest(
+                player_name=player_name,
+                score=5,
+                correct_taps=5,
+                wrong_taps=0,
+                duration_ms=20000,
+            )
+        )
+        entries = TapP40LeaderboardStore(leaderboard_path).get_leaderboard()
+
+    assert saved.saved_run.player_name == player_name
+    assert [entry.player_name for entry in entries] == [player_name]